@@ -1,23 +1,101 @@
 """
 Options P/L Calculator with Black-Scholes pricing and Greeks
-Implements Black-Scholes from scratch using scipy
+Implements Black-Scholes from scratch using NumPy and scipy.special
 """
 
+import math
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
+from dataclasses import dataclass, field
 from datetime import date
+from enum import IntEnum
 from typing import List, Dict, Optional
 from functools import lru_cache
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from market_data import calculate_days_to_expiration, MarketDataFetcher
+from market_data import calculate_days_to_expiration, parse_expiration_date
 from tastytrade_client import get_tastytrade_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_SQRT_HALF = math.sqrt(0.5)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF for one value; erfc keeps the lower tail accurate"""
+    return 0.5 * math.erfc(-x * _SQRT_HALF)
+
+
+def _norm_pdf(x: float) -> float:
+    """Standard normal PDF for one value"""
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+@dataclass(frozen=True)
+class BSContext:
+    """
+    Black-Scholes terms that depend only on the expiry, rate and dividend yield
+
+    Build one per expiration and pass it as `ctx` to calculate_black_scholes_prices
+    when pricing several strikes against that expiry, so sqrt(T), e^(-rT) and
+    e^(-qT) are computed once instead of on every call.
+
+    Args:
+        T: Time to expiration in years
+        r: Risk-free rate (annual, as decimal)
+        q: Continuous dividend yield (annual, as decimal)
+    """
+    T: float
+    r: float
+    q: float = 0.0
+    sqrt_T: float = field(init=False)
+    disc: float = field(init=False)
+    divd: float = field(init=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields have to bypass __setattr__
+        object.__setattr__(self, 'sqrt_T', math.sqrt(self.T))
+        object.__setattr__(self, 'disc', math.exp(-self.r * self.T))
+        object.__setattr__(self, 'divd', math.exp(-self.q * self.T))
+
+    @classmethod
+    def from_days(cls, days_to_expiration: int, risk_free_rate: float, dividend_yield: float = 0.0) -> "BSContext":
+        """Context for a DTE in calendar days, matching calculate_black_scholes_price"""
+        return cls(days_to_expiration / 365.0, risk_free_rate, dividend_yield)
+
+
+class OptType(IntEnum):
+    """Option type as a payoff sign, for branchless vectorized pricing"""
+    CALL = 1
+    PUT = -1
+
+    @classmethod
+    def from_flag(cls, option_type) -> "OptType":
+        """Accept an OptType or the public 'C'/'P' flag (any case)"""
+        if isinstance(option_type, cls):
+            return option_type
+        return cls.CALL if option_type.upper() == 'C' else cls.PUT
+
+    @property
+    def flag(self) -> str:
+        """The 'C'/'P' flag taken by the scalar pricing functions"""
+        return 'C' if self is OptType.CALL else 'P'
+
+
+# Order of the columns in a per-position Greeks matrix
+_GREEK_NAMES = ('delta', 'gamma', 'theta', 'vega', 'rho')
+
+
+def _aggregate_greeks(qtys: List[float], greek_rows: List[List[float]]) -> Dict[str, float]:
+    """Quantity-weighted portfolio Greeks: qtys @ greek_matrix in one contraction"""
+    totals = np.asarray(qtys, dtype=np.float64) @ np.asarray(greek_rows, dtype=np.float64).reshape(-1, len(_GREEK_NAMES))
+    return dict(zip(_GREEK_NAMES, totals.tolist()))
+
+
 # Index symbols that trade European-style options
 INDEX_SYMBOLS = {'SPX', 'NDX', 'RUT', 'VIX', 'DJX', 'XSP', 'XND'}
 
@@ -150,16 +228,16 @@ def calculate_black_scholes_price(
 
         if option_type.upper() == 'C':
             # Call option with dividends: S * e^(-qT) * N(d1) - K * e^(-rT) * N(d2)
-            price = (stock_price * np.exp(-dividend_yield * time_to_expiration) * norm.cdf(d1) -
-                    strike * np.exp(-risk_free_rate * time_to_expiration) * norm.cdf(d2))
+            price = (stock_price * np.exp(-dividend_yield * time_to_expiration) * _norm_cdf(d1) -
+                    strike * np.exp(-risk_free_rate * time_to_expiration) * _norm_cdf(d2))
         else:
             # Put option with dividends: K * e^(-rT) * N(-d2) - S * e^(-qT) * N(-d1)
-            price = (strike * np.exp(-risk_free_rate * time_to_expiration) * norm.cdf(-d2) -
-                    stock_price * np.exp(-dividend_yield * time_to_expiration) * norm.cdf(-d1))
+            price = (strike * np.exp(-risk_free_rate * time_to_expiration) * _norm_cdf(-d2) -
+                    stock_price * np.exp(-dividend_yield * time_to_expiration) * _norm_cdf(-d1))
 
         return float(price)
     except Exception as e:
-        logger.warning(f"Black-Scholes calculation failed: {e}. Returning intrinsic value.")
+        logger.warning("Black-Scholes calculation failed: %s. Returning intrinsic value.", e)
         # Fall back to intrinsic value
         if option_type.upper() == 'C':
             return max(0, stock_price - strike)
@@ -202,7 +280,7 @@ def calculate_american_greeks_finite_diff(
     
     # Validate inputs to prevent division by zero
     if stock_price <= 0 or strike <= 0 or implied_volatility <= 0:
-        logger.warning(f"Invalid parameters for American Greeks: S={stock_price}, K={strike}, IV={implied_volatility}")
+        logger.warning("Invalid parameters for American Greeks: S=%s, K=%s, IV=%s", stock_price, strike, implied_volatility)
         return {
             'delta': 0.0,
             'gamma': 0.0,
@@ -296,8 +374,8 @@ def calculate_american_greeks_finite_diff(
         }
 
     except Exception as e:
-        logger.warning(f"American Greeks calculation failed: {e}")
-        logger.warning(f"Parameters: type={option_type}, S={stock_price}, K={strike}, DTE={days_to_expiration}, r={risk_free_rate}, IV={implied_volatility}")
+        logger.warning("American Greeks calculation failed: %s", e)
+        logger.warning("Parameters: type=%s, S=%s, K=%s, DTE=%s, r=%s, IV=%s", option_type, stock_price, strike, days_to_expiration, risk_free_rate, implied_volatility)
         return {
             'delta': 0.0,
             'gamma': 0.0,
@@ -345,7 +423,7 @@ def calculate_option_greeks(
         api_greeks = _get_greeks_from_api(symbol, strike, expiration_str, option_type)
         if api_greeks:
             return api_greeks
-        logger.info(f"API Greeks not available for {symbol} {strike} {option_type}, using local calculation")
+        logger.info("API Greeks not available for %s %s %s, using local calculation", symbol, strike, option_type)
     
     # Fallback to local calculation
     return _calculate_local_greeks(
@@ -371,19 +449,18 @@ def _get_greeks_from_api(
             return None
         
         # Convert expiration string to ISO format (YYYY-MM-DD)
-        fetcher = MarketDataFetcher()
         try:
-            exp_date = fetcher.parse_expiration_date(expiration_str)
+            exp_date = parse_expiration_date(expiration_str)
             expiration_iso = exp_date.strftime('%Y-%m-%d')
         except ValueError:
-            logger.warning(f"Could not parse expiration date: {expiration_str}")
+            logger.warning("Could not parse expiration date: %s", expiration_str)
             return None
         
         # Fetch from API
         return client.get_option_greeks(symbol, strike, expiration_iso, option_type)
         
     except Exception as e:
-        logger.warning(f"Error fetching API Greeks: {e}")
+        logger.warning("Error fetching API Greeks: %s", e)
         return None
 
 
@@ -445,31 +522,31 @@ def _calculate_local_greeks(
 
         # Delta (adjusted for dividends)
         if option_type.upper() == 'C':
-            delta = discount_factor * norm.cdf(d1)
+            delta = discount_factor * _norm_cdf(d1)
         else:
-            delta = -discount_factor * norm.cdf(-d1)
+            delta = -discount_factor * _norm_cdf(-d1)
 
         # Gamma (same for calls and puts, adjusted for dividends)
-        gamma = (discount_factor * norm.pdf(d1)) / (stock_price * implied_volatility * np.sqrt(time_to_expiration))
+        gamma = (discount_factor * _norm_pdf(d1)) / (stock_price * implied_volatility * np.sqrt(time_to_expiration))
 
         # Theta (time decay - expressed as per day, so divide by 365)
         if option_type.upper() == 'C':
-            theta = (- (stock_price * discount_factor * norm.pdf(d1) * implied_volatility) / (2 * np.sqrt(time_to_expiration))
-                    - risk_free_rate * strike * np.exp(-risk_free_rate * time_to_expiration) * norm.cdf(d2)
-                    + dividend_yield * stock_price * discount_factor * norm.cdf(d1)) / 365
+            theta = (- (stock_price * discount_factor * _norm_pdf(d1) * implied_volatility) / (2 * np.sqrt(time_to_expiration))
+                    - risk_free_rate * strike * np.exp(-risk_free_rate * time_to_expiration) * _norm_cdf(d2)
+                    + dividend_yield * stock_price * discount_factor * _norm_cdf(d1)) / 365
         else:
-            theta = (- (stock_price * discount_factor * norm.pdf(d1) * implied_volatility) / (2 * np.sqrt(time_to_expiration))
-                    + risk_free_rate * strike * np.exp(-risk_free_rate * time_to_expiration) * norm.cdf(-d2)
-                    - dividend_yield * stock_price * discount_factor * norm.cdf(-d1)) / 365
+            theta = (- (stock_price * discount_factor * _norm_pdf(d1) * implied_volatility) / (2 * np.sqrt(time_to_expiration))
+                    + risk_free_rate * strike * np.exp(-risk_free_rate * time_to_expiration) * _norm_cdf(-d2)
+                    - dividend_yield * stock_price * discount_factor * _norm_cdf(-d1)) / 365
 
         # Vega (same for calls and puts, adjusted for dividends)
-        vega = stock_price * discount_factor * norm.pdf(d1) * np.sqrt(time_to_expiration) / 100
+        vega = stock_price * discount_factor * _norm_pdf(d1) * np.sqrt(time_to_expiration) / 100
 
         # Rho (sensitivity to interest rate) - expressed as per 1% change in rate
         if option_type.upper() == 'C':
-            rho = strike * time_to_expiration * np.exp(-risk_free_rate * time_to_expiration) * norm.cdf(d2) / 100
+            rho = strike * time_to_expiration * np.exp(-risk_free_rate * time_to_expiration) * _norm_cdf(d2) / 100
         else:
-            rho = -strike * time_to_expiration * np.exp(-risk_free_rate * time_to_expiration) * norm.cdf(-d2) / 100
+            rho = -strike * time_to_expiration * np.exp(-risk_free_rate * time_to_expiration) * _norm_cdf(-d2) / 100
 
         return {
             'delta': float(delta),
@@ -479,7 +556,7 @@ def _calculate_local_greeks(
             'rho': float(rho)
         }
     except Exception as e:
-        logger.warning(f"Greeks calculation failed: {e}")
+        logger.warning("Greeks calculation failed: %s", e)
         return {
             'delta': 0.0,
             'gamma': 0.0,
@@ -489,6 +566,80 @@ def _calculate_local_greeks(
         }
 
 
+def calculate_price_and_greeks(
+    option_type: str,
+    stock_price: float,
+    strike: float,
+    days_to_expiration: int,
+    risk_free_rate: float,
+    implied_volatility: float,
+    dividend_yield: float = 0.0,
+    option_style: str = "European"
+) -> tuple:
+    """
+    Calculate theoretical price and local Greeks from one set of d1/d2 terms
+
+    Returns the same values as calculate_black_scholes_price followed by
+    _calculate_local_greeks, but computes d1, d2, N(d1), N(d2), n(d1) and the
+    discount factors once. American options and degenerate inputs defer to
+    those two functions.
+
+    Returns:
+        Tuple of (price per share, dict with delta, gamma, theta, vega, rho)
+    """
+    args = (
+        option_type, stock_price, strike, days_to_expiration,
+        risk_free_rate, implied_volatility, dividend_yield, option_style
+    )
+    if option_style == "American" or days_to_expiration <= 0 or implied_volatility <= 0:
+        return calculate_black_scholes_price(*args), _calculate_local_greeks(*args)
+
+    time_to_expiration = days_to_expiration / 365.0
+    try:
+        d1, d2 = calculate_d1_d2(stock_price, strike, time_to_expiration, risk_free_rate, implied_volatility, dividend_yield)
+        if d1 is None or d2 is None:
+            return calculate_black_scholes_price(*args), _calculate_local_greeks(*args)
+
+        sqrt_t = np.sqrt(time_to_expiration)
+        discount_factor = np.exp(-dividend_yield * time_to_expiration)
+        rate_discount = np.exp(-risk_free_rate * time_to_expiration)
+        pdf_d1 = _norm_pdf(d1)
+        time_decay = -(stock_price * discount_factor * pdf_d1 * implied_volatility) / (2 * sqrt_t)
+
+        if option_type.upper() == 'C':
+            cdf_d1 = _norm_cdf(d1)
+            cdf_d2 = _norm_cdf(d2)
+            price = stock_price * discount_factor * cdf_d1 - strike * rate_discount * cdf_d2
+            delta = discount_factor * cdf_d1
+            theta = (time_decay
+                    - risk_free_rate * strike * rate_discount * cdf_d2
+                    + dividend_yield * stock_price * discount_factor * cdf_d1) / 365
+            rho = strike * time_to_expiration * rate_discount * cdf_d2 / 100
+        else:
+            cdf_d1 = _norm_cdf(-d1)
+            cdf_d2 = _norm_cdf(-d2)
+            price = strike * rate_discount * cdf_d2 - stock_price * discount_factor * cdf_d1
+            delta = -discount_factor * cdf_d1
+            theta = (time_decay
+                    + risk_free_rate * strike * rate_discount * cdf_d2
+                    - dividend_yield * stock_price * discount_factor * cdf_d1) / 365
+            rho = -strike * time_to_expiration * rate_discount * cdf_d2 / 100
+
+        gamma = (discount_factor * pdf_d1) / (stock_price * implied_volatility * sqrt_t)
+        vega = stock_price * discount_factor * pdf_d1 * sqrt_t / 100
+
+        return float(price), {
+            'delta': float(delta),
+            'gamma': float(gamma),
+            'theta': float(theta),
+            'vega': float(vega),
+            'rho': float(rho)
+        }
+    except Exception as e:
+        logger.warning("Combined price/Greeks calculation failed: %s", e)
+        return calculate_black_scholes_price(*args), _calculate_local_greeks(*args)
+
+
 def calculate_intrinsic_value(option_type: str, stock_price: float, strike: float) -> float:
     """
     Calculate intrinsic value of an option
@@ -507,6 +658,63 @@ def calculate_intrinsic_value(option_type: str, stock_price: float, strike: floa
         return max(0, strike - stock_price)
 
 
+def calculate_intrinsic_values(option_type: str, stock_prices: np.ndarray, strike: float) -> np.ndarray:
+    """Vectorized calculate_intrinsic_value over an array of stock prices ('C'/'P' or OptType)"""
+    sign = OptType.from_flag(option_type)
+    return np.maximum(0.0, sign * (np.asarray(stock_prices, dtype=np.float64) - strike))
+
+
+def calculate_black_scholes_prices(
+    option_type: str,
+    stock_prices: np.ndarray,
+    strike: float,
+    days_to_expiration: int,
+    risk_free_rate: float,
+    implied_volatility: float,
+    dividend_yield: float = 0.0,
+    option_style: str = "European",
+    ctx: Optional[BSContext] = None
+) -> np.ndarray:
+    """
+    Vectorized calculate_black_scholes_price over an array of stock prices
+
+    European options are priced in one NumPy expression across the whole
+    price grid; American options still walk a binomial tree per price.
+    An optional BSContext supplies the expiry terms; it must have been built
+    from the same days_to_expiration, risk_free_rate and dividend_yield.
+    option_type may be 'C'/'P' or an OptType.
+
+    Returns:
+        Array of theoretical option prices per share, aligned with stock_prices
+    """
+    stock_prices = np.asarray(stock_prices, dtype=np.float64)
+    sign = OptType.from_flag(option_type)
+
+    if option_style == "American":
+        return np.array([
+            calculate_black_scholes_price(
+                sign.flag, stock_price, strike, days_to_expiration,
+                risk_free_rate, implied_volatility, dividend_yield, option_style
+            )
+            for stock_price in stock_prices.tolist()
+        ], dtype=np.float64)
+
+    if days_to_expiration <= 0 or implied_volatility <= 0:
+        return calculate_intrinsic_values(sign, stock_prices, strike)
+
+    if ctx is None:
+        ctx = BSContext.from_days(days_to_expiration, risk_free_rate, dividend_yield)
+    elif (ctx.T, ctx.r, ctx.q) != (days_to_expiration / 365.0, risk_free_rate, dividend_yield):
+        raise ValueError("ctx does not match days_to_expiration, risk_free_rate and dividend_yield")
+    vol_sqrt_t = implied_volatility * ctx.sqrt_T
+    with np.errstate(divide='ignore'):
+        d1 = (np.log(stock_prices / strike) + (ctx.r - ctx.q + 0.5 * implied_volatility ** 2) * ctx.T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+
+    # Calls and puts share one expression: sign * (S·e^(-qT)·N(sign·d1) - K·e^(-rT)·N(sign·d2))
+    return sign * (stock_prices * ctx.divd * ndtr(sign * d1) - strike * ctx.disc * ndtr(sign * d2))
+
+
 def calculate_american_option_binomial(
     option_type: str,
     stock_price: float,
@@ -539,61 +747,133 @@ def calculate_american_option_binomial(
         return calculate_intrinsic_value(option_type, stock_price, strike)
 
     if implied_volatility <= 0 or stock_price <= 0 or strike <= 0:
-        logger.warning(f"Invalid parameters for binomial tree: S={stock_price}, K={strike}, IV={implied_volatility}")
+        logger.warning("Invalid parameters for binomial tree: S=%s, K=%s, IV=%s", stock_price, strike, implied_volatility)
         return calculate_intrinsic_value(option_type, stock_price, strike)
 
     try:
-        # Time parameters
-        time_to_expiration = days_to_expiration / 365.0
-        dt = time_to_expiration / steps
+        american_price, _ = _binomial_rollback(
+            option_type, stock_price, strike, days_to_expiration,
+            risk_free_rate, implied_volatility, dividend_yield, steps,
+            track_european=False
+        )
+        return american_price
 
-        # Binomial tree parameters
-        u = np.exp(implied_volatility * np.sqrt(dt))  # Up factor
-        d = 1 / u  # Down factor
+    except Exception as e:
+        logger.warning("American option pricing failed: %s", e)
+        return calculate_intrinsic_value(option_type, stock_price, strike)
 
-        # Risk-neutral probability (adjusted for dividends)
-        a = np.exp((risk_free_rate - dividend_yield) * dt)
-        p = (a - d) / (u - d)
 
-        # Discount factor for one step
-        discount = np.exp(-risk_free_rate * dt)
+def _binomial_both(
+    option_type: str,
+    stock_price: float,
+    strike: float,
+    days_to_expiration: int,
+    risk_free_rate: float,
+    implied_volatility: float,
+    dividend_yield: float = 0.0,
+    steps: int = 100
+) -> tuple:
+    """
+    Price the European and American option from a single binomial tree
 
-        # Pre-compute power arrays for vectorization
-        i_arr = np.arange(steps + 1)
+    Both styles share the lattice, terminal payoff and discounting; only the
+    American values take the early-exercise maximum at each step. The American
+    price equals calculate_american_option_binomial for the same inputs.
 
-        # Initialize stock prices at maturity (vectorized)
-        stock_prices = stock_price * (u ** (steps - i_arr)) * (d ** i_arr)
+    Returns:
+        Tuple of (european_price, american_price) per share
+    """
+    intrinsic = calculate_intrinsic_value(option_type, stock_price, strike)
+    if days_to_expiration <= 0:
+        return intrinsic, intrinsic
 
-        # Initialize option values at maturity (vectorized)
-        is_call = option_type.upper() == 'C'
-        if is_call:
-            option_values = np.maximum(0, stock_prices - strike)
-        else:
-            option_values = np.maximum(0, strike - stock_prices)
+    if implied_volatility <= 0 or stock_price <= 0 or strike <= 0:
+        logger.warning("Invalid parameters for binomial tree: S=%s, K=%s, IV=%s", stock_price, strike, implied_volatility)
+        return intrinsic, intrinsic
+
+    try:
+        american_price, european_price = _binomial_rollback(
+            option_type, stock_price, strike, days_to_expiration,
+            risk_free_rate, implied_volatility, dividend_yield, steps,
+            track_european=True
+        )
+        return european_price, american_price
 
-        # Step backwards through the tree (vectorized inner loop)
-        for step in range(steps - 1, -1, -1):
-            # Vectorized: Calculate stock prices at this step
-            j_arr = np.arange(step + 1)
-            S_arr = stock_price * (u ** (step - j_arr)) * (d ** j_arr)
+    except Exception as e:
+        logger.warning("American option pricing failed: %s", e)
+        return intrinsic, intrinsic
 
-            # Vectorized: Calculate hold values
-            hold_values = discount * (p * option_values[:step + 1] + (1 - p) * option_values[1:step + 2])
 
-            # Vectorized: Calculate exercise values
-            if is_call:
-                exercise_values = np.maximum(0, S_arr - strike)
-            else:
-                exercise_values = np.maximum(0, strike - S_arr)
+def _binomial_rollback(
+    option_type: str,
+    stock_price: float,
+    strike: float,
+    days_to_expiration: int,
+    risk_free_rate: float,
+    implied_volatility: float,
+    dividend_yield: float,
+    steps: int,
+    track_european: bool
+) -> tuple:
+    """
+    Roll a Cox-Ross-Rubinstein tree back to today for validated inputs
+
+    Returns:
+        Tuple of (american_price, european_price or None)
+    """
+    # Time parameters
+    time_to_expiration = days_to_expiration / 365.0
+    dt = time_to_expiration / steps
 
-            # For American options, take maximum of hold vs exercise (vectorized)
-            option_values[:step + 1] = np.maximum(hold_values, exercise_values)
+    # Binomial tree parameters
+    u = np.exp(implied_volatility * np.sqrt(dt))  # Up factor
+    d = 1 / u  # Down factor
 
-        return float(option_values[0])
+    # Risk-neutral probability (adjusted for dividends)
+    a = np.exp((risk_free_rate - dividend_yield) * dt)
+    p = (a - d) / (u - d)
 
-    except Exception as e:
-        logger.warning(f"American option pricing failed: {e}")
-        return calculate_intrinsic_value(option_type, stock_price, strike)
+    # Discount factor for one step
+    discount = np.exp(-risk_free_rate * dt)
+
+    # Pre-compute power arrays for vectorization
+    i_arr = np.arange(steps + 1)
+
+    # Initialize stock prices at maturity (vectorized)
+    stock_prices = stock_price * (u ** (steps - i_arr)) * (d ** i_arr)
+
+    # Initialize option values at maturity (vectorized)
+    is_call = option_type.upper() == 'C'
+    if is_call:
+        option_values = np.maximum(0, stock_prices - strike)
+    else:
+        option_values = np.maximum(0, strike - stock_prices)
+    european_values = option_values.copy() if track_european else None
+
+    # Step backwards through the tree (vectorized inner loop)
+    for step in range(steps - 1, -1, -1):
+        # Vectorized: Calculate stock prices at this step
+        j_arr = np.arange(step + 1)
+        S_arr = stock_price * (u ** (step - j_arr)) * (d ** j_arr)
+
+        # Vectorized: Calculate hold values
+        hold_values = discount * (p * option_values[:step + 1] + (1 - p) * option_values[1:step + 2])
+
+        # Vectorized: Calculate exercise values
+        if is_call:
+            exercise_values = np.maximum(0, S_arr - strike)
+        else:
+            exercise_values = np.maximum(0, strike - S_arr)
+
+        # For American options, take maximum of hold vs exercise (vectorized)
+        option_values[:step + 1] = np.maximum(hold_values, exercise_values)
+
+        # European values only ever hold
+        if track_european:
+            european_values[:step + 1] = discount * (p * european_values[:step + 1] + (1 - p) * european_values[1:step + 2])
+
+    european_price = float(european_values[0]) if track_european else None
+    return float(option_values[0]), european_price
 
 
 def calculate_pl(
@@ -688,12 +968,11 @@ def calculate_pl(
         if pos.get('manual_iv'):
             position_ivs[idx] = pos['manual_iv']
             manual_iv_positions.add(idx)
-            logger.info(f"Position {idx}: Using manual IV={pos['manual_iv']:.2%}")
+            logger.info("Position %s: Using manual IV=%.2f%%", idx, pos['manual_iv'] * 100)
         elif market_data and market_data.get('symbol'):
             try:
                 # Parse expiration to ISO format for API
-                fetcher = MarketDataFetcher()
-                exp_date = fetcher.parse_expiration_date(pos.get('expiration', ''))
+                exp_date = parse_expiration_date(pos.get('expiration', ''))
                 expiration_iso = exp_date.strftime('%Y-%m-%d')
                 positions_to_fetch.append({
                     'index': idx,
@@ -703,7 +982,7 @@ def calculate_pl(
                     'option_type': pos['type']
                 })
             except ValueError:
-                logger.debug(f"Could not parse expiration for position {idx}")
+                logger.debug("Could not parse expiration for position %s", idx)
                 position_ivs[idx] = default_iv
 
     # Batch fetch all positions from API in one call
@@ -734,27 +1013,35 @@ def calculate_pl(
                         if greeks_data.get('implied_volatility'):
                             position_ivs[idx] = greeks_data['implied_volatility']
                             position_greeks_from_api[idx] = greeks_data
-                            logger.info(f"Position {idx}: Using API IV={greeks_data['implied_volatility']:.2%} for {p['option_type']}{p['strike']}")
+                            logger.info("Position %s: Using API IV=%.2f%% for %s%s", idx, greeks_data['implied_volatility'] * 100, p['option_type'], p['strike'])
                         else:
                             position_ivs[idx] = default_iv
-                            logger.info(f"Position {idx}: No IV from API, using default ATM IV={default_iv:.2%}")
+                            logger.info("Position %s: No IV from API, using default ATM IV=%.2f%%", idx, default_iv * 100)
                     else:
                         position_ivs[idx] = default_iv
-                        logger.info(f"Position {idx}: API fetch failed, using default ATM IV={default_iv:.2%}")
+                        logger.info("Position %s: API fetch failed, using default ATM IV=%.2f%%", idx, default_iv * 100)
             else:
                 # Tastytrade not configured, use default IV
                 for p in positions_to_fetch:
                     position_ivs[p['index']] = default_iv
-                    logger.info(f"Position {p['index']}: Using default ATM IV={default_iv:.2%}")
+                    logger.info("Position %s: Using default ATM IV=%.2f%%", p['index'], default_iv * 100)
         except Exception as e:
-            logger.warning(f"Batch API fetch failed: {e}")
+            logger.warning("Batch API fetch failed: %s", e)
             for p in positions_to_fetch:
                 position_ivs[p['index']] = default_iv
-                logger.info(f"Position {p['index']}: Using default ATM IV={default_iv:.2%}")
+                logger.info("Position %s: Using default ATM IV=%.2f%%", p['index'], default_iv * 100)
+
+    # Days to expiration per position, resolved once for every helper below
+    position_dtes = (
+        [calculate_days_to_expiration(pos['expiration'], current_date) for pos in positions]
+        if can_calculate_bs else []
+    )
 
     # Calculate Greeks for each position at current stock price
     # Skip if skip_greeks_curve is True for faster P/L-only calculation
     positions_with_greeks = []
+    position_qtys = []
+    position_greek_rows = []
 
     if can_calculate_bs and not skip_greeks_curve:
         current_stock_price = market_data['current_price']
@@ -764,7 +1051,7 @@ def calculate_pl(
         underlying_symbol = market_data.get('symbol') if market_data else None
 
         for idx, pos in enumerate(positions):
-            dte = calculate_days_to_expiration(pos['expiration'], current_date)
+            dte = position_dtes[idx]
             iv = position_ivs.get(idx, default_iv)  # Use pre-computed per-strike IV
             dividend_yield = pos.get('dividend_yield') or default_dividend_yield
             option_style = get_option_style(pos.get('style'), underlying_symbol)
@@ -772,10 +1059,22 @@ def calculate_pl(
             # Use API-fetched Greeks if available, otherwise calculate locally
             if idx in position_greeks_from_api:
                 option_greeks = position_greeks_from_api[idx]
-                logger.debug(f"Position {idx}: Using API Greeks")
+                logger.debug("Position %s: Using API Greeks", idx)
+
+                # Calculate theoretical value at current stock price
+                theoretical_value = calculate_black_scholes_price(
+                    pos['type'],
+                    current_stock_price,
+                    pos['strike'],
+                    dte,
+                    risk_free_rate,
+                    iv,
+                    dividend_yield,
+                    option_style  # Already set to pos.get('style', 'American')
+                )
             else:
-                # Calculate Greeks locally (uses the same IV)
-                option_greeks = _calculate_local_greeks(
+                # Price and local Greeks share d1/d2 (uses the same IV)
+                theoretical_value, option_greeks = calculate_price_and_greeks(
                     pos['type'],
                     current_stock_price,
                     pos['strike'],
@@ -786,18 +1085,6 @@ def calculate_pl(
                     option_style
                 )
 
-            # Calculate theoretical value at current stock price
-            theoretical_value = calculate_black_scholes_price(
-                pos['type'],
-                current_stock_price,
-                pos['strike'],
-                dte,
-                risk_free_rate,
-                iv,
-                dividend_yield,
-                option_style  # Already set to pos.get('style', 'American')
-            )
-
             # Calculate intrinsic value at current stock price
             intrinsic_value = calculate_intrinsic_value(
                 pos['type'],
@@ -807,6 +1094,8 @@ def calculate_pl(
 
             # Adjust Greeks by position quantity (negative for short positions)
             adjusted_greeks = {k: v * pos['qty'] for k, v in option_greeks.items()}
+            position_qtys.append(pos['qty'])
+            position_greek_rows.append([option_greeks[k] for k in _GREEK_NAMES])
 
             positions_with_greeks.append({
                 'position': pos,
@@ -820,13 +1109,7 @@ def calculate_pl(
     # Calculate portfolio Greeks (sum of position Greeks)
     portfolio_greeks = None
     if positions_with_greeks:
-        portfolio_greeks = {
-            'delta': sum(p['greeks']['delta'] for p in positions_with_greeks),
-            'gamma': sum(p['greeks']['gamma'] for p in positions_with_greeks),
-            'theta': sum(p['greeks']['theta'] for p in positions_with_greeks),
-            'vega': sum(p['greeks']['vega'] for p in positions_with_greeks),
-            'rho': sum(p['greeks']['rho'] for p in positions_with_greeks)
-        }
+        portfolio_greeks = _aggregate_greeks(position_qtys, position_greek_rows)
 
     # Helper to calculate intrinsic P/L for a single price (at expiration)
     def get_intrinsic_pl(stock_price):
@@ -841,88 +1124,61 @@ def calculate_pl(
 
         return total_pl
 
-    # Helper to calculate theoretical P/L for a single price (Black-Scholes)
-    def get_theoretical_pl(stock_price):
-        if not can_calculate_bs:
-            return get_intrinsic_pl(stock_price)
-
-        total_pl = float(credit)
-        risk_free_rate = market_data['risk_free_rate']
-        default_dividend_yield = market_data.get('dividend_yield', 0.0)
-
-        underlying_symbol = market_data.get('symbol') if market_data else None
-
-        for idx, pos in enumerate(positions):
-            qty = pos['qty']
-            strike = pos['strike']
-            option_type = pos['type']
-
-            dte = calculate_days_to_expiration(pos['expiration'], current_date)
-            iv = position_ivs.get(idx, default_iv)  # Use pre-computed per-strike IV
-            dividend_yield = pos.get('dividend_yield') or default_dividend_yield
-            option_style = get_option_style(pos.get('style'), underlying_symbol)
-
-            # Calculate theoretical value
-            theoretical_value = calculate_black_scholes_price(
-                option_type,
-                stock_price,
-                strike,
-                dte,
-                risk_free_rate,
-                iv,
-                dividend_yield,
-                option_style
-            )
-
-            total_pl += qty * theoretical_value * 100  # 100 shares per contract
-
+    # Helper to calculate intrinsic P/L across a price grid (at expiration)
+    def get_intrinsic_pl_curve(price_grid):
+        total_pl = np.full(price_grid.shape, float(credit))
+        for pos in positions:
+            intrinsic = calculate_intrinsic_values(pos['type'], price_grid, pos['strike'])
+            total_pl += pos['qty'] * intrinsic * 100  # 100 shares per contract
         return total_pl
 
-    # Helper to calculate P/L at a specific number of days from now
-    def get_pl_at_future_date(stock_price, days_from_now):
-        """
-        Calculate P/L as if we're `days_from_now` days in the future.
-        The DTE for each position is reduced by `days_from_now`.
-        """
+    # Helper to calculate theoretical P/L across a price grid, as if we're
+    # `days_from_now` days in the future (0 = today). Each position is priced
+    # for the whole grid at once; the DTE is reduced by `days_from_now`.
+    def get_pl_curve(price_grid, days_from_now=0):
         if not can_calculate_bs:
-            return get_intrinsic_pl(stock_price)
+            return get_intrinsic_pl_curve(price_grid)
 
-        total_pl = float(credit)
+        total_pl = np.full(price_grid.shape, float(credit))
         risk_free_rate = market_data['risk_free_rate']
         default_dividend_yield = market_data.get('dividend_yield', 0.0)
         underlying_symbol = market_data.get('symbol')
+        # Legs sharing an expiry and dividend yield reuse one set of expiry terms
+        contexts = {}
 
         for idx, pos in enumerate(positions):
             qty = pos['qty']
             strike = pos['strike']
             option_type = pos['type']
 
-            # Original DTE from today
-            original_dte = calculate_days_to_expiration(pos['expiration'], current_date)
-            # Adjusted DTE (as if we're in the future)
+            # Original DTE from today, adjusted as if we're in the future
+            original_dte = position_dtes[idx]
             adjusted_dte = max(0, original_dte - days_from_now)
 
             iv = position_ivs.get(idx, default_iv)  # Use pre-computed per-strike IV
             dividend_yield = pos.get('dividend_yield') or default_dividend_yield
             option_style = get_option_style(pos.get('style'), underlying_symbol)
 
-            # Calculate option value at the future date
             if adjusted_dte <= 0:
                 # At or past expiration, use intrinsic value
-                option_value = calculate_intrinsic_value(option_type, stock_price, strike)
+                option_values = calculate_intrinsic_values(option_type, price_grid, strike)
             else:
-                option_value = calculate_black_scholes_price(
+                ctx_key = (adjusted_dte, dividend_yield)
+                if ctx_key not in contexts:
+                    contexts[ctx_key] = BSContext.from_days(adjusted_dte, risk_free_rate, dividend_yield)
+                option_values = calculate_black_scholes_prices(
                     option_type,
-                    stock_price,
+                    price_grid,
                     strike,
                     adjusted_dte,
                     risk_free_rate,
                     iv,
                     dividend_yield,
-                    option_style
+                    option_style,
+                    ctx=contexts[ctx_key]
                 )
 
-            total_pl += qty * option_value * 100  # 100 shares per contract
+            total_pl += qty * option_values * 100  # 100 shares per contract
 
         return total_pl
 
@@ -934,18 +1190,13 @@ def calculate_pl(
         risk_free_rate = market_data['risk_free_rate']
         default_dividend_yield = market_data.get('dividend_yield', 0.0)
 
-        portfolio_greeks_at_price = {
-            'delta': 0.0,
-            'gamma': 0.0,
-            'theta': 0.0,
-            'vega': 0.0,
-            'rho': 0.0
-        }
+        qtys = []
+        greek_rows = []
 
         underlying_symbol = market_data.get('symbol') if market_data else None
 
         for idx, pos in enumerate(positions):
-            dte = calculate_days_to_expiration(pos['expiration'], current_date)
+            dte = position_dtes[idx]
             iv = position_ivs.get(idx, default_iv)  # Use pre-computed per-strike IV
             dividend_yield = pos.get('dividend_yield') or default_dividend_yield
             option_style = get_option_style(pos.get('style'), underlying_symbol)
@@ -962,11 +1213,11 @@ def calculate_pl(
                 option_style
             )
 
-            # Accumulate position-weighted Greeks
-            for greek_name in portfolio_greeks_at_price.keys():
-                portfolio_greeks_at_price[greek_name] += greeks[greek_name] * pos['qty']
+            qtys.append(pos['qty'])
+            greek_rows.append([greeks[k] for k in _GREEK_NAMES])
 
-        return portfolio_greeks_at_price
+        # Position-weighted sum of Greeks
+        return _aggregate_greeks(qtys, greek_rows)
 
     # Calculate exact breakeven points for intrinsic value
     breakeven_points = []
@@ -998,20 +1249,24 @@ def calculate_pl(
     # Calculate Greeks only for every Nth point to optimize performance (especially for American options)
     greek_calculation_interval = 2  # Calculate Greeks every 2 price points for performance/granularity balance
 
-    for idx, price in enumerate(all_prices):
-        intrinsic_pl = get_intrinsic_pl(price)
-        theoretical_pl = get_theoretical_pl(price) if can_calculate_bs else intrinsic_pl
+    # Evaluate each P/L curve over the whole grid at once
+    price_grid = np.array(all_prices, dtype=np.float64)
+    intrinsic_pls = get_intrinsic_pl_curve(price_grid).tolist()
+    theoretical_pls = get_pl_curve(price_grid).tolist() if can_calculate_bs else intrinsic_pls
+    pls_at_date = None
+    if eval_days_from_now is not None and can_calculate_bs:
+        pls_at_date = get_pl_curve(price_grid, eval_days_from_now).tolist()
 
+    for idx, price in enumerate(all_prices):
         data_point = {
             "price": float(price),
-            "pl": float(round(intrinsic_pl, 2)),  # At expiration
-            "theoretical_pl": float(round(theoretical_pl, 2))  # Current theoretical
+            "pl": float(round(intrinsic_pls[idx], 2)),  # At expiration
+            "theoretical_pl": float(round(theoretical_pls[idx], 2))  # Current theoretical
         }
 
         # Add P/L at selected future date if specified
-        if eval_days_from_now is not None and can_calculate_bs:
-            pl_at_date = get_pl_at_future_date(price, eval_days_from_now)
-            data_point["pl_at_date"] = float(round(pl_at_date, 2))
+        if pls_at_date is not None:
+            data_point["pl_at_date"] = float(round(pls_at_date[idx], 2))
 
         # Add Greeks at this price point for visualization (only every Nth point for performance)
         # Skip entirely if skip_greeks_curve is True (for faster P/L-only calculation)
@@ -1024,7 +1279,7 @@ def calculate_pl(
                     data_point["theta"] = float(round(greeks_at_price['theta'], 4))
                     data_point["vega"] = float(round(greeks_at_price['vega'], 4))
             except Exception as e:
-                logger.warning(f"Failed to calculate Greeks at price {price}: {e}")
+                logger.warning("Failed to calculate Greeks at price %s: %s", price, e)
                 # Continue without Greeks for this point
 
         data_points.append(data_point)
@@ -1052,15 +1307,9 @@ def calculate_pl(
             dates_to_compute.append(max_dte)
 
         precomputed_dates = {}
-        # Extract just the prices from data_points for consistent ordering
-        price_list = [dp['price'] for dp in data_points]
-
+        # Same grid (and ordering) as data_points
         for days in dates_to_compute:
-            pl_values = []
-            for price in price_list:
-                pl = get_pl_at_future_date(price, days)
-                pl_values.append(round(pl, 2))
-            precomputed_dates[days] = pl_values
+            precomputed_dates[days] = [round(pl, 2) for pl in get_pl_curve(price_grid, days).tolist()]
 
     return {
         'data': data_points,
@@ -0,0 +1,29 @@
+import pytest
+
+
+# Request bodies are only serialized, never mutated, so they are shared as-is
+SHORT_STRANGLE_PAYLOAD = {
+    "positions": [
+        {"qty": -1, "expiration": "Jan 16", "strike": 100.0, "type": "P"},
+        {"qty": -1, "expiration": "Jan 16", "strike": 110.0, "type": "C"},
+    ],
+    "credit": 500.0
+}
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole run; lifespan starts and stops once."""
+    # Imported here so schema-only runs never load the app or Starlette
+    from fastapi.testclient import TestClient
+    from main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def calc_response_short_strangle(client):
+    """Status and JSON body of one valid /calculate call, shared by read-only tests."""
+    response = client.post("/calculate", json=SHORT_STRANGLE_PAYLOAD)
+    return response.status_code, response.json()
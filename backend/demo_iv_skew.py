@@ -8,7 +8,6 @@ import asyncio
 import logging
 from datetime import datetime, timedelta
 from tastytrade_client import get_tastytrade_client
-import httpx
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
@@ -30,65 +29,43 @@ async def test_tsla_iv_from_market_prices():
     print(f"Using Newton-Raphson Black-Scholes inversion")
     print(f"{'='*70}\n")
 
-    # Get available expirations
-    if not client._ensure_token():
-        print("❌ Failed to get access token")
-        return
-
     try:
-        response = httpx.get(
-            f"https://api.tastyworks.com/option-chains/{symbol}/nested",
-            headers={"Authorization": f"Bearer {client._access_token}"},
-            timeout=15.0
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        items = data.get("data", {}).get("items", [])
-        if not items:
+        # Chain comes from the client's pooled, cached lookup instead of a
+        # separate one-off connection
+        chain = client.get_option_chain(symbol)
+        expirations = chain["expirations"]
+        if not expirations:
             print("❌ No data found")
             return
 
-        first_item = items[0]
-        expirations = first_item.get("expirations", [])
-
         # Find an expiration 15-45 days out
-        from market_data import MarketDataFetcher
-        fetcher = MarketDataFetcher()
+        from market_data import parse_expiration_date
 
         target_exp = None
-        target_exp_data = None
+        strikes = []
 
-        for exp in expirations:
-            exp_date_str = exp.get("expiration-date", "")
-            if not exp_date_str or not exp.get("strikes"):
+        for exp_date_str in expirations:
+            if not chain["strikes_by_expiration"].get(exp_date_str):
                 continue
 
             try:
-                exp_date = fetcher.parse_expiration_date(exp_date_str)
+                exp_date = parse_expiration_date(exp_date_str)
                 dte = (exp_date - datetime.now().date()).days
 
                 if 15 <= dte <= 45:
                     target_exp = exp_date_str
-                    target_exp_data = exp
+                    strikes = chain["strikes_by_expiration"][exp_date_str]
                     print(f"📅 Selected expiration: {exp_date_str} ({dte} DTE)")
                     break
             except Exception:
                 continue
 
-        if not target_exp_data:
+        if not target_exp:
             print("❌ No suitable expiration found")
             return
 
-        # Get strikes from the selected expiration
-        strikes = target_exp_data.get("strikes", [])
-
         # Select strikes to test (spread across the range)
-        strike_prices = []
-        for i, s in enumerate(strikes):
-            sp = client._safe_float(s.get("strike-price"))
-            if sp:
-                strike_prices.append(int(sp))
+        strike_prices = [int(sp) for sp in strikes if sp]
 
         # Sample across the range
         sample_size = min(15, len(strike_prices))
@@ -107,14 +84,27 @@ async def test_tsla_iv_from_market_prices():
 
         results = []
 
+        # One batched quote request for every call and put, instead of two
+        # round trips per strike
+        greeks_by_key = client.get_batch_option_greeks([
+            {
+                'symbol': symbol,
+                'strike': float(strike),
+                'expiration_date': target_exp,
+                'option_type': option_type,
+            }
+            for strike in strikes_to_test
+            for option_type in ('C', 'P')
+        ])
+
         for strike in strikes_to_test:
-            # Fetch Call Greeks (with calculated IV)
-            call_data = client.get_option_greeks(symbol, float(strike), target_exp, 'C')
+            # Call Greeks (with calculated IV)
+            call_data = greeks_by_key.get(f"{symbol}_{float(strike)}_{target_exp}_C")
             call_iv = call_data.get('implied_volatility') if call_data else None
             call_delta = call_data.get('delta') if call_data else None
 
-            # Fetch Put Greeks (with calculated IV)
-            put_data = client.get_option_greeks(symbol, float(strike), target_exp, 'P')
+            # Put Greeks (with calculated IV)
+            put_data = greeks_by_key.get(f"{symbol}_{float(strike)}_{target_exp}_P")
             put_iv = put_data.get('implied_volatility') if put_data else None
             put_delta = put_data.get('delta') if put_data else None
 
@@ -0,0 +1,97 @@
+"""
+Persistent response cache for upstream market data.
+
+Backed by SQLite from the standard library so cached quotes survive restarts
+and are shared by every worker process pointed at the same file.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """Small namespaced JSON cache with per-entry expiry."""
+
+    def __init__(self, path: str):
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        with self._conn:
+            # WAL lets readers in other workers proceed during a write.
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    value TEXT NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the stored value, or None when missing, expired, or unreadable."""
+        entry = self.get_entry(namespace, key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, namespace: str, key: str) -> Optional[Tuple[Any, float]]:
+        """Return (value, seconds until expiry), or None like get()."""
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM entries "
+                    "WHERE namespace = ? AND key = ? AND expires_at > ?",
+                    # Wall-clock time: expiry must mean the same thing to
+                    # every process that opens the file.
+                    (namespace, key, now),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Disk cache read failed for %s/%s: %s", namespace, key, e)
+            return None
+
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0]), row[1] - now
+        except ValueError:
+            return None
+
+    def set(self, namespace: str, key: str, value: Any, ttl_seconds: float) -> None:
+        """Store a JSON-serializable value; failures are logged, never raised."""
+        try:
+            payload = json.dumps(value)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                    (namespace, key, time.time() + ttl_seconds, payload),
+                )
+        except (TypeError, ValueError, sqlite3.Error) as e:
+            logger.warning("Disk cache write failed for %s/%s: %s", namespace, key, e)
+
+    def purge_expired(self) -> None:
+        """Drop expired rows so the file stays proportional to the live set."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE expires_at <= ?", (time.time(),)
+                )
+        except sqlite3.Error as e:
+            logger.warning("Disk cache purge failed: %s", e)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -36,6 +36,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST"],
     allow_headers=["Content-Type", "Authorization"],
+    # Let browsers cache preflights for an hour instead of Starlette's 10 minutes
+    max_age=3600,
 )
 
 # Add GZip compression for responses > 1KB
@@ -134,7 +136,6 @@ def get_volatility_skew(symbol: str, expiration: str):
 
         # Validate expiration format
         try:
-            from datetime import datetime
             datetime.strptime(expiration, "%Y-%m-%d")
         except ValueError:
             raise HTTPException(
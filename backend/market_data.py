@@ -7,7 +7,9 @@ Data Sources:
 """
 
 import os
+import time
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Tuple
 import logging
 
@@ -32,6 +34,9 @@ class MarketDataFetcher:
             cache_duration_minutes: How long to cache data (default: 10 minutes)
         """
         self.cache_duration = timedelta(minutes=cache_duration_minutes)
+        # key -> (time.monotonic(), datetime.now(), data). TTL checks use the
+        # monotonic stamp so clock jumps cannot revive or expire entries; the
+        # wall-clock stamp only answers "same calendar day?".
         self._cache = {}
 
         # Configuration
@@ -46,30 +51,30 @@ class MarketDataFetcher:
         if cache_key not in self._cache:
             return False
 
-        cached_time, _ = self._cache[cache_key]
-        return datetime.now() - cached_time < self.cache_duration
+        cached_at, _, _ = self._cache[cache_key]
+        return time.monotonic() - cached_at < self.cache_duration.total_seconds()
 
     def _is_daily_cache_valid(self, cache_key: str) -> bool:
         """Check if cached data is still valid for the current calendar day"""
         if cache_key not in self._cache:
             return False
 
-        cached_time, _ = self._cache[cache_key]
+        _, cached_time, _ = self._cache[cache_key]
         # Valid if cached time is from same calendar day
         return cached_time.date() == datetime.now().date()
 
     def _get_from_cache(self, cache_key: str) -> Optional[any]:
         """Retrieve data from cache if valid"""
         if self._is_cache_valid(cache_key):
-            _, data = self._cache[cache_key]
-            logger.info(f"Cache hit for {cache_key}")
+            _, _, data = self._cache[cache_key]
+            logger.info("Cache hit for %s", cache_key)
             return data
         return None
 
     def _set_cache(self, cache_key: str, data: any):
         """Store data in cache with timestamp"""
-        self._cache[cache_key] = (datetime.now(), data)
-        logger.info(f"Cached data for {cache_key}")
+        self._cache[cache_key] = (time.monotonic(), datetime.now(), data)
+        logger.info("Cached data for %s", cache_key)
 
     def get_stock_price(self, symbol: str) -> float:
         """
@@ -114,11 +119,11 @@ class MarketDataFetcher:
                 raise ValueError(f"Invalid price data for {symbol}")
 
             self._set_cache(cache_key, float(price))
-            logger.info(f"Fetched price for {yahoo_symbol}: ${price:.2f}")
+            logger.info("Fetched price for %s: $%.2f", yahoo_symbol, price)
             return float(price)
 
         except Exception as e:
-            logger.error(f"Failed to fetch price for {symbol}: {e}")
+            logger.error("Failed to fetch price for %s: %s", symbol, e)
             raise ValueError(f"Could not fetch stock price for {symbol}. Please verify the symbol or enter price manually.")
 
     def get_implied_volatility(
@@ -156,23 +161,23 @@ class MarketDataFetcher:
                 if metrics and metrics.get('implied_volatility') is not None:
                     iv = metrics['implied_volatility']
                     if iv > 0:
-                        logger.info(f"Using Tastytrade IV Index for {symbol}: {iv:.2%}")
+                        logger.info("Using Tastytrade IV Index for %s: %.2f%%", symbol, iv * 100)
                         self._set_cache(cache_key, iv)
                         return iv
 
             # Fall back to historical volatility
             hv = self.calculate_historical_volatility(symbol, days=20)
             if hv is not None:
-                logger.info(f"Using historical volatility for {symbol}: {hv:.2%}")
+                logger.info("Using historical volatility for %s: %.2f%%", symbol, hv * 100)
                 self._set_cache(cache_key, hv)
                 return hv
 
             # Method 4: Use default IV
-            logger.warning(f"Could not calculate IV for {symbol}, using default: {self.default_iv:.2%}")
+            logger.warning("Could not calculate IV for %s, using default: %.2f%%", symbol, self.default_iv * 100)
             return self.default_iv
 
         except Exception as e:
-            logger.error(f"Error fetching IV for {symbol}: {e}")
+            logger.error("Error fetching IV for %s: %s", symbol, e)
             return self.default_iv
 
     def calculate_historical_volatility(self, symbol: str, days: int = 20) -> Optional[float]:
@@ -198,7 +203,7 @@ class MarketDataFetcher:
             hist = ticker.history(period=f"{days + 5}d")  # Extra days for safety
 
             if hist.empty or len(hist) < days:
-                logger.warning(f"Insufficient historical data for {symbol}")
+                logger.warning("Insufficient historical data for %s", symbol)
                 return None
 
             # Calculate log returns
@@ -215,11 +220,11 @@ class MarketDataFetcher:
                 return None
 
             self._set_cache(cache_key, float(volatility))
-            logger.info(f"Calculated HV for {symbol}: {volatility:.2%}")
+            logger.info("Calculated HV for %s: %.2f%%", symbol, volatility * 100)
             return float(volatility)
 
         except Exception as e:
-            logger.error(f"Error calculating historical volatility for {symbol}: {e}")
+            logger.error("Error calculating historical volatility for %s: %s", symbol, e)
             return None
 
     def calculate_iv_rank(self, symbol: str, current_iv: float) -> Optional[float]:
@@ -247,7 +252,7 @@ class MarketDataFetcher:
             if metrics and metrics.get('iv_rank') is not None:
                 iv_rank = metrics['iv_rank']
                 self._set_cache(cache_key, float(iv_rank))
-                logger.info(f"Tastytrade IV Rank for {symbol}: {iv_rank:.1f}%")
+                logger.info("Tastytrade IV Rank for %s: %.1f%%", symbol, iv_rank)
                 return float(iv_rank)
         
         # Fallback: Calculate from historical volatility range
@@ -268,7 +273,7 @@ class MarketDataFetcher:
             hist = ticker.history(period='1y')
             
             if hist.empty or len(hist) < 20:
-                logger.warning(f"Insufficient historical data for IV rank: {symbol}")
+                logger.warning("Insufficient historical data for IV rank: %s", symbol)
                 return None
             
             # Calculate rolling 20-day historical volatility for each day
@@ -293,11 +298,11 @@ class MarketDataFetcher:
             iv_rank = max(0, min(100, iv_rank))
             
             self._set_cache(cache_key, float(iv_rank))
-            logger.info(f"Calculated HV-based IV Rank for {symbol}: {iv_rank:.1f}% (approximation)")
+            logger.info("Calculated HV-based IV Rank for %s: %.1f%% (approximation)", symbol, iv_rank)
             return float(iv_rank)
             
         except Exception as e:
-            logger.error(f"Error calculating IV rank for {symbol}: {e}")
+            logger.error("Error calculating IV rank for %s: %s", symbol, e)
             return None
 
     def get_risk_free_rate(self) -> float:
@@ -315,9 +320,8 @@ class MarketDataFetcher:
         
         # Use daily cache validation instead of time-based
         if self._is_daily_cache_valid(cache_key):
-            cached_rate = self._cache[cache_key][1]
-            cached_time = self._cache[cache_key][0]
-            logger.info(f"Using cached risk-free rate from {cached_time.strftime('%Y-%m-%d %H:%M:%S')}: {cached_rate:.2%}")
+            _, cached_time, cached_rate = self._cache[cache_key]
+            logger.info("Using cached risk-free rate from %s: %.2f%%", cached_time.strftime('%Y-%m-%d %H:%M:%S'), cached_rate * 100)
             return cached_rate
 
         try:
@@ -346,18 +350,18 @@ class MarketDataFetcher:
                 # Sanity check: rate should be between 0% and 20%
                 if 0 < rate < 0.20:
                     self._set_cache(cache_key, rate)
-                    logger.info(f"Fetched live risk-free rate (10Y Treasury): {rate:.2%} - cached until end of day")
+                    logger.info("Fetched live risk-free rate (10Y Treasury): %.2f%% - cached until end of day", rate * 100)
                     return rate
                 else:
-                    logger.warning(f"Risk-free rate out of range: {rate}, using default")
+                    logger.warning("Risk-free rate out of range: %s, using default", rate)
             
         except Exception as e:
-            logger.warning(f"Failed to fetch live risk-free rate: {e}")
+            logger.warning("Failed to fetch live risk-free rate: %s", e)
         
         # Fallback to default
         rate = self.default_risk_free_rate
         self._set_cache(cache_key, rate)
-        logger.info(f"Using default risk-free rate: {rate:.2%} - cached until end of day")
+        logger.info("Using default risk-free rate: %.2f%% - cached until end of day", rate * 100)
         return rate
 
     def parse_expiration_date(
@@ -368,75 +372,93 @@ class MarketDataFetcher:
         """
         Parse expiration date string to date object
 
-        Handles formats:
-        - "Jan 16" (assumes nearest future date)
-        - "2025-01-16" (ISO format)
-        - "1/16/2025" (US format)
-        - "01/16/25" (US format short year)
-
-        Args:
-            expiration_str: Expiration date string
-            reference_date: Reference date for "Jan 16" format (default: today)
-
-        Returns:
-            date object
-
-        Raises:
-            ValueError: If format is not recognized
+        See the module-level parse_expiration_date for supported formats.
         """
-        if reference_date is None:
-            reference_date = date.today()
-
-        expiration_str = expiration_str.strip()
-
-        # Try ISO format (YYYY-MM-DD)
-        try:
-            return datetime.strptime(expiration_str, '%Y-%m-%d').date()
-        except ValueError:
-            pass
-
-        # Try US format with full year (M/D/YYYY or MM/DD/YYYY)
-        try:
-            return datetime.strptime(expiration_str, '%m/%d/%Y').date()
-        except ValueError:
-            pass
+        return parse_expiration_date(expiration_str, reference_date)
 
-        # Try US format with short year (M/D/YY or MM/DD/YY)
-        try:
-            return datetime.strptime(expiration_str, '%m/%d/%y').date()
-        except ValueError:
-            pass
-
-        # Try "Jan 17 26" format (month day short-year)
-        try:
-            parsed = datetime.strptime(expiration_str, '%b %d %y')
-            return parsed.date()
-        except ValueError:
-            pass
 
-        # Try "Jan 16" format (assumes current or next year)
-        try:
-            # Parse month and day
-            parsed = datetime.strptime(expiration_str, '%b %d')
+def parse_expiration_date(
+    expiration_str: str,
+    reference_date: Optional[date] = None
+) -> date:
+    """
+    Parse expiration date string to date object
 
-            # Assume current year first
-            exp_date = parsed.replace(year=reference_date.year).date()
+    Handles formats:
+    - "Jan 16" (assumes nearest future date)
+    - "2025-01-16" (ISO format)
+    - "1/16/2025" (US format)
+    - "01/16/25" (US format short year)
 
-            # If the date is in the past by more than 30 days, assume next year
-            # Otherwise, treat as expired (options typically expire within same year cycle)
-            days_diff = (reference_date - exp_date).days
-            if days_diff > 30:
-                exp_date = parsed.replace(year=reference_date.year + 1).date()
+    Args:
+        expiration_str: Expiration date string
+        reference_date: Reference date for "Jan 16" format (default: today)
 
-            return exp_date
-        except ValueError:
-            pass
+    Returns:
+        date object
 
-        # If all parsing attempts fail
-        raise ValueError(
-            f"Could not parse expiration date: '{expiration_str}'. "
-            f"Supported formats: 'Jan 17 26', 'Jan 16', '2025-01-16', '1/16/2025', '01/16/25'"
-        )
+    Raises:
+        ValueError: If format is not recognized
+    """
+    if reference_date is None:
+        reference_date = date.today()
+
+    return _parse_expiration_date(expiration_str.strip(), reference_date)
+
+
+# Every position and P/L grid point re-parses the same few expirations;
+# the reference date is part of the key, so "Jan 16" stays date-relative.
+@lru_cache(maxsize=256)
+def _parse_expiration_date(expiration_str: str, reference_date: date) -> date:
+    """Cached parser behind parse_expiration_date; failures are not cached"""
+    # Try ISO format (YYYY-MM-DD)
+    try:
+        return datetime.strptime(expiration_str, '%Y-%m-%d').date()
+    except ValueError:
+        pass
+
+    # Try US format with full year (M/D/YYYY or MM/DD/YYYY)
+    try:
+        return datetime.strptime(expiration_str, '%m/%d/%Y').date()
+    except ValueError:
+        pass
+
+    # Try US format with short year (M/D/YY or MM/DD/YY)
+    try:
+        return datetime.strptime(expiration_str, '%m/%d/%y').date()
+    except ValueError:
+        pass
+
+    # Try "Jan 17 26" format (month day short-year)
+    try:
+        parsed = datetime.strptime(expiration_str, '%b %d %y')
+        return parsed.date()
+    except ValueError:
+        pass
+
+    # Try "Jan 16" format (assumes current or next year)
+    try:
+        # Parse month and day
+        parsed = datetime.strptime(expiration_str, '%b %d')
+
+        # Assume current year first
+        exp_date = parsed.replace(year=reference_date.year).date()
+
+        # If the date is in the past by more than 30 days, assume next year
+        # Otherwise, treat as expired (options typically expire within same year cycle)
+        days_diff = (reference_date - exp_date).days
+        if days_diff > 30:
+            exp_date = parsed.replace(year=reference_date.year + 1).date()
+
+        return exp_date
+    except ValueError:
+        pass
+
+    # If all parsing attempts fail
+    raise ValueError(
+        f"Could not parse expiration date: '{expiration_str}'. "
+        f"Supported formats: 'Jan 17 26', 'Jan 16', '2025-01-16', '1/16/2025', '01/16/25'"
+    )
 
 
 def calculate_days_to_expiration(
@@ -450,7 +472,7 @@ def calculate_days_to_expiration(
     Args:
         expiration_str: Expiration date string
         current_date: Current date (default: today)
-        fetcher: MarketDataFetcher instance (optional, creates new if not provided)
+        fetcher: MarketDataFetcher instance (optional; parses directly if not provided)
 
     Returns:
         Days until expiration (0 if expired)
@@ -459,9 +481,9 @@ def calculate_days_to_expiration(
         current_date = date.today()
 
     if fetcher is None:
-        fetcher = MarketDataFetcher()
-
-    exp_date = fetcher.parse_expiration_date(expiration_str, current_date)
+        exp_date = parse_expiration_date(expiration_str, current_date)
+    else:
+        exp_date = fetcher.parse_expiration_date(expiration_str, current_date)
     dte = (exp_date - current_date).days
 
     # Return 0 for expired options (negative DTE)
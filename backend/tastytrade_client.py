@@ -7,19 +7,33 @@ Note: Sandbox accounts do NOT return market metrics - production account require
 """
 
 import os
+import importlib.util
 import logging
+import math
+import random
 import time
 import threading
+import traceback
 import httpx
+import numpy as np
 from collections import OrderedDict
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from copy import deepcopy
+from functools import lru_cache
 from email.utils import parsedate_to_datetime
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List
+from urllib.parse import quote
+from datetime import date, datetime, timezone
 
 from dotenv import load_dotenv
 
+from disk_cache import DiskCache
+
+try:  # Optional: faster decoding for float-heavy quote payloads.
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -27,6 +41,29 @@ logger = logging.getLogger(__name__)
 
 # Tastytrade API endpoints
 TASTYTRADE_API_URL = "https://api.tastyworks.com"
+USER_AGENT = "option-visualizer/0.1"
+# Yahoo's autocomplete endpoint backs symbol search when Tastytrade cannot.
+YAHOO_SEARCH_URL = "https://query2.finance.yahoo.com/v1/finance/search"
+YAHOO_SEARCH_QUOTE_TYPES = frozenset({"EQUITY", "ETF"})
+# HTTP/2 lets parallel chain, metrics and quote calls share one connection.
+# It needs the optional h2 package (`httpx[http2]`); HTTP/1.1 otherwise.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# Throttling and transient gateway errors; other statuses return immediately.
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Bytes of encoded ?symbols= query allowed per /market-data call, well under
+# common 8 KB request-line limits so large chunks never draw a 414.
+QUOTE_QUERY_BUDGET_BYTES = 7000
+# Symbols per /market-metrics call when refreshing several underlyings.
+MARKET_METRICS_CHUNK_MAX_SYMBOLS = 100
+# Client-wide default; quote, chain and Yahoo calls set their own budgets.
+REQUEST_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+# Connection attempts httpx repeats before a request has been sent.
+CONNECT_RETRIES = 2
+# Refresh in the background once this share of the token lifetime has passed.
+TOKEN_EARLY_REFRESH_FRACTION = 0.8
+TOKEN_REFRESH_RETRY_SECONDS = 30.0
+# Callers queued behind a failed refresh reuse its outcome for this long.
+TOKEN_FAILURE_BACKOFF_SECONDS = 5.0
 SKEW_TARGET_DELTA = 0.25
 SKEW_DELTA_TOLERANCE = 0.05
 SKEW_ATM_MONEYNESS_TOLERANCE = 0.05
@@ -57,6 +94,19 @@ _REQUEST_MAX_CONCURRENCY = _env_int("TASTYTRADE_MAX_CONCURRENT_REQUESTS", 2)
 _REQUEST_SEMAPHORE = threading.BoundedSemaphore(_REQUEST_MAX_CONCURRENCY)
 _REQUEST_PACING_LOCK = threading.Lock()
 _NEXT_REQUEST_AT = 0.0
+# One pool definition for the owned client. Keep-alive covers every request
+# the semaphore admits at once, so paced bursts reuse warm connections.
+_HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=max(8, _REQUEST_MAX_CONCURRENCY),
+    max_keepalive_connections=max(4, _REQUEST_MAX_CONCURRENCY),
+    keepalive_expiry=30.0,
+)
+# Shared by every batch so chunk fan-out does not spawn threads per call.
+# Sized to the semaphore: more workers would only queue on it.
+_QUOTE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_REQUEST_MAX_CONCURRENCY,
+    thread_name_prefix="tastytrade-quotes",
+)
 
 
 def summarize_volatility_skew(
@@ -145,6 +195,85 @@ def summarize_volatility_skew(
     }
 
 
+# (Greeks dict key, /market-data quote field). Tastytrade's "volatility" is
+# implied volatility as a decimal (e.g., 0.8435 for 84.35% IV).
+_GREEK_FIELDS = (
+    ("delta", "delta"),
+    ("gamma", "gamma"),
+    ("theta", "theta"),
+    ("vega", "vega"),
+    ("rho", "rho"),
+    ("implied_volatility", "volatility"),
+    ("bid", "bid"),
+    ("ask", "ask"),
+    ("mark", "mark"),
+    ("last", "last"),
+    ("theo_price", "theo-price"),
+)
+# Quote fields the Greeks extraction reads; the rest are dropped.
+_QUOTE_FIELDS = tuple(api_field for _, api_field in _GREEK_FIELDS)
+# (metrics dict key, /market-metrics field, scale); ranks arrive as 0-1.
+_METRIC_FIELDS = (
+    ("iv_rank", "implied-volatility-index-rank", 100),
+    ("iv_percentile", "implied-volatility-percentile", 100),
+    ("implied_volatility", "implied-volatility-index", 1),
+    ("beta", "beta", 1),
+)
+
+@lru_cache(maxsize=1024)
+def _normalize_expiration(raw_expiration: str) -> Optional[str]:
+    """Return YYYY-MM-DD for a chain expiration, or None if unparseable.
+
+    Chains list the same few dozen expirations on every refresh, so results
+    are memoized by the raw string.
+    """
+    try:
+        if "T" in raw_expiration:
+            expiration_date = datetime.fromisoformat(
+                raw_expiration.replace("Z", "+00:00").replace("+0000", "+00:00")
+            )
+            return expiration_date.date().isoformat()
+        return date.fromisoformat(raw_expiration).isoformat()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _osi_expiration(expiration_date: str) -> str:
+    """YYMMDD for an ISO date; a batch repeats one expiration across strikes.
+
+    Raises ValueError for impossible dates, which are not cached.
+    """
+    exp = date.fromisoformat(expiration_date)
+    return f"{exp.year % 100:02d}{exp.month:02d}{exp.day:02d}"
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a response body with orjson when installed, else httpx's json."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _decode_items(response: httpx.Response) -> list:
+    """Return the ``data.items`` list of a Tastytrade response, or []."""
+    data = _decode_json(response).get("data")
+    return data.get("items", []) if data else []
+
+
+def _open_disk_cache(path: str) -> Optional[DiskCache]:
+    """Open the optional persistent cache; a bad path only disables it."""
+    if not path:
+        return None
+    try:
+        cache = DiskCache(path)
+        cache.purge_expired()
+        return cache
+    except Exception as e:
+        logger.warning("Tastytrade disk cache disabled (%s): %s", path, e)
+        return None
+
+
 class TastytradeClient:
     """Client for Tastytrade API using direct REST calls"""
 
@@ -161,11 +290,17 @@ class TastytradeClient:
         self.client_secret = os.getenv('TASTYTRADE_CLIENT_SECRET', '')
         self.refresh_token = os.getenv('TASTYTRADE_REFRESH_TOKEN', '')
         self._access_token: Optional[str] = None
-        self._token_expiry: Optional[datetime] = None
+        # time.monotonic() deadline; 0.0 means no usable token.
+        self._token_deadline = 0.0
         self._token_lock = threading.Lock()
+        self._token_retry_at = 0.0
+        self._token_refresh_timer: threading.Timer | None = None
+        self._closed = False
         self._greeks_cache: OrderedDict[
             str, tuple[float, Dict[str, Any]]
         ] = OrderedDict()
+        # Keyed by OSI symbol, which is canonical per contract.
+        self._greeks_inflight: Dict[str, Future[Optional[Dict[str, Any]]]] = {}
         self._greeks_cache_lock = threading.Lock()
         self._greeks_cache_ttl_seconds = _env_float(
             "TASTYTRADE_GREEKS_CACHE_SECONDS", 300.0
@@ -195,6 +330,10 @@ class TastytradeClient:
         self._option_chain_inflight: Dict[
             str, Future[Dict[str, Any]]
         ] = {}
+        # Last ETag and body per symbol, kept past the TTL for revalidation.
+        self._option_chain_validators: OrderedDict[
+            str, tuple[str, Dict[str, Any]]
+        ] = OrderedDict()
         self._option_chain_cache_lock = threading.Lock()
         self._option_chain_cache_ttl_seconds = _env_float(
             "TASTYTRADE_OPTION_CHAIN_CACHE_SECONDS", 300.0
@@ -202,6 +341,27 @@ class TastytradeClient:
         self._option_chain_cache_max_entries = _env_int(
             "TASTYTRADE_OPTION_CHAIN_CACHE_MAX_ENTRIES", 32
         )
+        self._metrics_cache: OrderedDict[
+            str, tuple[float, Dict[str, Any]]
+        ] = OrderedDict()
+        self._metrics_cache_lock = threading.Lock()
+        self._metrics_cache_ttl_seconds = _env_float(
+            "TASTYTRADE_MARKET_METRICS_CACHE_SECONDS", 60.0
+        )
+        self._metrics_cache_max_entries = _env_int(
+            "TASTYTRADE_MARKET_METRICS_CACHE_MAX_ENTRIES", 256
+        )
+        self._search_cache: OrderedDict[str, tuple[float, list]] = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        self._search_cache_ttl_seconds = _env_float(
+            "TASTYTRADE_SEARCH_CACHE_SECONDS", 60.0
+        )
+        self._search_cache_max_entries = _env_int(
+            "TASTYTRADE_SEARCH_CACHE_MAX_ENTRIES", 512
+        )
+        self._quote_chunk_max_symbols = _env_int(
+            "TASTYTRADE_QUOTE_CHUNK_MAX_SYMBOLS", 350
+        )
         self._request_min_interval_seconds = _env_float(
             "TASTYTRADE_MIN_REQUEST_INTERVAL_SECONDS", 0.25
         )
@@ -212,13 +372,27 @@ class TastytradeClient:
             "TASTYTRADE_RATE_LIMIT_MAX_DELAY_SECONDS", 30.0
         )
         self._http_client = http_client or httpx.Client(
-            limits=httpx.Limits(
-                max_connections=8,
-                max_keepalive_connections=4,
-                keepalive_expiry=30.0,
-            )
+            headers={"User-Agent": USER_AGENT},
+            timeout=REQUEST_TIMEOUT,
+            # Pool and protocol settings live on the transport once one is given.
+            transport=httpx.HTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=_HTTP_POOL_LIMITS,
+                retries=CONNECT_RETRIES,
+            ),
         )
         self._owns_http_client = http_client is None
+        # Opt-in: lets restarts and sibling workers reuse recent responses.
+        self._disk_cache = _open_disk_cache(
+            os.getenv("TASTYTRADE_DISK_CACHE_PATH", "")
+        )
+        # Quotes and metrics are persisted with their in-memory TTLs, so a
+        # restart or sibling worker never sees them older than a live cache
+        # would. Chain structure (expirations and strikes) changes at most
+        # daily and is kept longer, but is only read on a cold start.
+        self._disk_option_chain_ttl_seconds = _env_float(
+            "TASTYTRADE_DISK_CACHE_OPTION_CHAIN_SECONDS", 86400.0
+        )
         self._enabled = bool(self.client_secret and self.refresh_token)
         
         if not self._enabled:
@@ -233,34 +407,94 @@ class TastytradeClient:
 
     def close(self) -> None:
         """Close the persistent HTTP connection pool owned by this client."""
+        with self._token_lock:
+            self._closed = True
+            if self._token_refresh_timer is not None:
+                self._token_refresh_timer.cancel()
+                self._token_refresh_timer = None
         if self._owns_http_client:
             self._http_client.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
+    def __enter__(self) -> "TastytradeClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def _get_cached_greeks(
         self, cache_key: str
     ) -> Optional[Dict[str, Any]]:
         """Return a fresh copy and keep the bounded cache in LRU order."""
-        now = time.monotonic()
         with self._greeks_cache_lock:
-            cached = self._greeks_cache.get(cache_key)
-            if cached is None:
-                return None
+            cached = self._get_memory_greeks_locked(cache_key)
+        if cached is not None:
+            return cached
 
-            cached_at, cached_data = cached
-            if now - cached_at >= self._greeks_cache_ttl_seconds:
-                del self._greeks_cache[cache_key]
-                return None
+        if self._disk_cache is None:
+            return None
+        entry = self._disk_cache.get_entry("greeks", cache_key)
+        if entry is None:
+            return None
+        persisted, remaining = entry
+        # Promote the disk hit for the rest of its lifetime, not a fresh TTL
+        self._remember_greeks(
+            cache_key,
+            persisted,
+            self._promoted_at(remaining, self._greeks_cache_ttl_seconds),
+        )
+        return deepcopy(persisted)
 
+    def _get_memory_greeks_locked(
+        self, cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """In-memory half of _get_cached_greeks; caller holds _greeks_cache_lock."""
+        cached = self._greeks_cache.get(cache_key)
+        if cached is None:
+            return None
+        cached_at, cached_data = cached
+        if time.monotonic() - cached_at < self._greeks_cache_ttl_seconds:
             self._greeks_cache.move_to_end(cache_key)
             return deepcopy(cached_data)
+        del self._greeks_cache[cache_key]
+        return None
 
     def _cache_greeks(
         self, cache_key: str, greeks: Dict[str, Any]
+    ) -> None:
+        """Store in memory and, when enabled, in the persistent cache."""
+        self._remember_greeks(cache_key, greeks)
+        if self._disk_cache is not None:
+            self._disk_cache.set(
+                "greeks", cache_key, greeks, self._greeks_cache_ttl_seconds
+            )
+
+    @staticmethod
+    def _promoted_at(remaining_seconds: float, ttl_seconds: float) -> float:
+        """Memory timestamp under which a disk row expires no later than on disk."""
+        return time.monotonic() - max(0.0, ttl_seconds - remaining_seconds)
+
+    def _remember_greeks(
+        self,
+        cache_key: str,
+        greeks: Dict[str, Any],
+        cached_at: float | None = None,
     ) -> None:
         """Store a defensive copy and evict the least recently used entries."""
+        now = time.monotonic()
         with self._greeks_cache_lock:
+            # Reclaim contracts nobody has read since they expired, so the
+            # cache does not sit at capacity with dead quotes.
+            while self._greeks_cache:
+                oldest_key = next(iter(self._greeks_cache))
+                cached_at, _ = self._greeks_cache[oldest_key]
+                if now - cached_at < self._greeks_cache_ttl_seconds:
+                    break
+                del self._greeks_cache[oldest_key]
+
             self._greeks_cache[cache_key] = (
-                time.monotonic(),
+                now if cached_at is None else cached_at,
                 deepcopy(greeks),
             )
             self._greeks_cache.move_to_end(cache_key)
@@ -315,7 +549,9 @@ class TastytradeClient:
                     )
 
         if delay is None:
-            delay = 0.5 * (2**attempt)
+            # Jittered exponential backoff keeps workers from retrying in step.
+            backoff = 0.5 * (2**attempt)
+            delay = backoff / 2 + random.uniform(0.0, backoff / 2)
 
         if retry_after and delay > self._rate_limit_max_delay_seconds:
             return None
@@ -334,26 +570,58 @@ class TastytradeClient:
             _NEXT_REQUEST_AT = now + self._request_min_interval_seconds
 
     def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
-        """Issue a pooled, paced request with bounded HTTP 429 retries."""
+        """Issue a request, renewing a rejected bearer token and retrying once."""
+        response = self._send_with_retries(method, url, **kwargs)
+
+        # The background refresh normally renews tokens before they lapse; a
+        # 401 means the token was revoked or expired early, so renew it here
+        # rather than failing the caller until the next scheduled refresh.
+        headers = kwargs.get("headers") or {}
+        authorization = headers.get("Authorization", "")
+        if response.status_code != 401 or not authorization.startswith("Bearer "):
+            return response
+        if not self._renew_rejected_token(authorization[len("Bearer "):]):
+            return response
+
+        logger.warning(
+            "Tastytrade rejected the access token; retrying %s %s once",
+            method.upper(),
+            url,
+        )
+        kwargs["headers"] = {
+            **headers,
+            "Authorization": f"Bearer {self._access_token}",
+        }
+        return self._send_with_retries(method, url, **kwargs)
+
+    def _send_with_retries(
+        self, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Issue a pooled, paced request with bounded 429/5xx retries."""
         for attempt in range(self._rate_limit_retries + 1):
             with _REQUEST_SEMAPHORE:
                 self._pace_request()
                 response = self._http_client.request(method, url, **kwargs)
 
             self._observe_rate_limit_headers(response)
-            if response.status_code != 429 or attempt >= self._rate_limit_retries:
+            if (
+                response.status_code not in RETRYABLE_STATUS_CODES
+                or attempt >= self._rate_limit_retries
+            ):
                 return response
 
             delay = self._retry_after_seconds(response, attempt)
             if delay is None:
                 logger.warning(
                     "Tastytrade Retry-After exceeds the %.2fs retry budget; "
-                    "returning HTTP 429 without an early retry",
+                    "returning HTTP %s without an early retry",
                     self._rate_limit_max_delay_seconds,
+                    response.status_code,
                 )
                 return response
             logger.warning(
-                "Tastytrade rate limited %s %s; retrying in %.2fs (%s/%s)",
+                "Tastytrade returned HTTP %s for %s %s; retrying in %.2fs (%s/%s)",
+                response.status_code,
                 method.upper(),
                 url,
                 delay,
@@ -371,20 +639,35 @@ class TastytradeClient:
         Returns:
             True if token is valid, False otherwise
         """
+        # Warm path: one clock read and one float compare, no allocation.
+        if (
+            self._access_token is not None
+            and time.monotonic() < self._token_deadline
+        ):
+            return True
+        return self._refresh_token()
+
+    def _refresh_token(self, force: bool = False) -> bool:
+        """
+        Refresh the OAuth access token unless another caller just did.
+
+        ``force`` is used by the early background refresh, which renews a token
+        that is still valid and must not discard it if the exchange fails.
+        """
         if not self._enabled:
             return False
 
-        # Check if token is still valid (tokens last 15 min, refresh at 14).
-        if self._access_token is not None and self._token_expiry is not None:
-            if datetime.now() < self._token_expiry:
-                return True
-
         # Multiple prefetch requests may arrive together. Only one should refresh
         # OAuth credentials while the others reuse the refreshed token.
         with self._token_lock:
-            if self._access_token is not None and self._token_expiry is not None:
-                if datetime.now() < self._token_expiry:
-                    return True
+            if (
+                not force
+                and self._access_token is not None
+                and time.monotonic() < self._token_deadline
+            ):
+                return True
+            if not force and time.monotonic() < self._token_retry_at:
+                return False
 
             try:
                 logger.info("Refreshing Tastytrade access token...")
@@ -397,17 +680,18 @@ class TastytradeClient:
                         "client_secret": self.client_secret,
                         "refresh_token": self.refresh_token,
                     },
-                    timeout=10.0,
                 )
                 response.raise_for_status()
 
-                data = response.json()
+                data = _decode_json(response)
                 self._access_token = data.get("access_token")
 
-                # Refresh 1 minute early to avoid edge cases.
+                # Tokens last 15 min; refresh 1 minute early to avoid edge cases.
                 expires_in = data.get("expires_in", 900)
-                self._token_expiry = datetime.now() + timedelta(
-                    seconds=max(0, expires_in - 60)
+                self._token_deadline = time.monotonic() + max(0, expires_in - 60)
+                self._token_retry_at = 0.0
+                self._schedule_token_refresh(
+                    max(0, expires_in) * TOKEN_EARLY_REFRESH_FRACTION
                 )
 
                 logger.info("Tastytrade access token refreshed successfully")
@@ -419,14 +703,47 @@ class TastytradeClient:
                     e.response.status_code,
                     e.response.text,
                 )
-                self._access_token = None
-                self._token_expiry = None
-                return False
             except Exception as e:
                 logger.error("Failed to refresh Tastytrade token: %s", e)
+
+            if time.monotonic() >= self._token_deadline:
                 self._access_token = None
-                self._token_expiry = None
-                return False
+                self._token_deadline = 0.0
+                self._token_retry_at = (
+                    time.monotonic() + TOKEN_FAILURE_BACKOFF_SECONDS
+                )
+            return False
+
+    def _renew_rejected_token(self, rejected_token: str) -> bool:
+        """Replace a token the API refused; concurrent 401s share one refresh."""
+        with self._token_lock:
+            if self._access_token and self._access_token != rejected_token:
+                return True  # Another caller already renewed it.
+            if self._access_token == rejected_token:
+                self._token_deadline = 0.0
+        return self._refresh_token()
+
+    def _schedule_token_refresh(self, delay: float) -> None:
+        """Arm the background refresh; the caller must hold ``_token_lock``."""
+        if self._token_refresh_timer is not None:
+            self._token_refresh_timer.cancel()
+            self._token_refresh_timer = None
+        if self._closed:
+            return
+
+        timer = threading.Timer(delay, self._background_token_refresh)
+        timer.daemon = True
+        self._token_refresh_timer = timer
+        timer.start()
+
+    def _background_token_refresh(self) -> None:
+        """Renew the token off the request path, retrying while it is valid."""
+        if self._refresh_token(force=True):
+            return
+
+        with self._token_lock:
+            if time.monotonic() < self._token_deadline:
+                self._schedule_token_refresh(TOKEN_REFRESH_RETRY_SECONDS)
 
     def get_market_metrics(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -445,46 +762,120 @@ class TastytradeClient:
                 'liquidity_rating': int,  # Options liquidity rating
             }
         """
-        if not self._ensure_token():
-            return None
+        return self.get_batch_market_metrics([symbol]).get(symbol.strip().upper())
+
+    def get_batch_market_metrics(
+        self, symbols: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch market metrics for several symbols with one request per chunk.
+
+        Args:
+            symbols: Stock ticker symbols (e.g., ['AAPL', 'SPY'])
 
+        Returns:
+            Dict mapping each upper-cased symbol to the metrics described in
+            ``get_market_metrics``; symbols without metrics are omitted.
+        """
+        # IV and IV Rank lookups for one request both land here, and UI
+        # refreshes repeat them; metrics move on a minute scale at best.
+        requested = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+        results: Dict[str, Dict[str, Any]] = {}
+        now = time.monotonic()
+        with self._metrics_cache_lock:
+            for cache_key in requested:
+                cached = self._metrics_cache.get(cache_key)
+                if cached is None:
+                    continue
+                cached_at, cached_result = cached
+                if now - cached_at < self._metrics_cache_ttl_seconds:
+                    self._metrics_cache.move_to_end(cache_key)
+                    results[cache_key] = deepcopy(cached_result)
+                else:
+                    del self._metrics_cache[cache_key]
+
+        if self._disk_cache is not None:
+            for cache_key in requested:
+                if cache_key in results:
+                    continue
+                entry = self._disk_cache.get_entry("metrics", cache_key)
+                if entry is None:
+                    continue
+                persisted, remaining = entry
+                # Promote for the rest of the row's lifetime, not a fresh TTL
+                self._remember_market_metrics(
+                    {cache_key: persisted},
+                    self._promoted_at(remaining, self._metrics_cache_ttl_seconds),
+                )
+                results[cache_key] = persisted
+
+        missing = [s for s in requested if s not in results]
+        # Cached metrics do not depend on the token; authenticate only on a miss.
+        if missing and not self._ensure_token():
+            return results
+
+        for start in range(0, len(missing), MARKET_METRICS_CHUNK_MAX_SYMBOLS):
+            chunk = missing[start:start + MARKET_METRICS_CHUNK_MAX_SYMBOLS]
+            fetched = self._fetch_market_metrics_chunk(chunk)
+            self._remember_market_metrics(fetched)
+            if self._disk_cache is not None:
+                for cache_key, result in fetched.items():
+                    self._disk_cache.set(
+                        "metrics", cache_key, result, self._metrics_cache_ttl_seconds
+                    )
+            results.update(fetched)
+
+        unavailable = [s for s in missing if s not in results]
+        if unavailable:
+            logger.warning("No market metrics returned for %s", ", ".join(unavailable))
+        return results
+
+    def _remember_market_metrics(
+        self,
+        metrics: Dict[str, Dict[str, Any]],
+        cached_at: float | None = None,
+    ) -> None:
+        """Store defensive copies and evict the least recently used symbols."""
+        if not metrics:
+            return
+        if cached_at is None:
+            cached_at = time.monotonic()
+        with self._metrics_cache_lock:
+            for cache_key, result in metrics.items():
+                self._metrics_cache[cache_key] = (cached_at, deepcopy(result))
+                self._metrics_cache.move_to_end(cache_key)
+            while len(self._metrics_cache) > self._metrics_cache_max_entries:
+                self._metrics_cache.popitem(last=False)
+
+    def _fetch_market_metrics_chunk(
+        self, symbols: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Request one comma-separated chunk and project each returned item."""
+        joined = ",".join(symbols)
         try:
-            # Fetch market metrics via REST API
             response = self._request(
                 "GET",
                 f"{TASTYTRADE_API_URL}/market-metrics",
-                params={"symbols": symbol},
+                params={"symbols": joined},
                 headers={"Authorization": f"Bearer {self._access_token}"},
-                timeout=10.0
             )
             response.raise_for_status()
-            
-            data = response.json()
-            items = data.get("data", {}).get("items", [])
-            
-            if not items:
-                logger.warning(f"No market metrics returned for {symbol}")
-                return None
-
-            metric = items[0]
-            
-            result = {
-                'iv_rank': self._safe_float(metric.get("implied-volatility-index-rank"), multiply_by=100),
-                'iv_percentile': self._safe_float(metric.get("implied-volatility-percentile"), multiply_by=100),
-                'implied_volatility': self._safe_float(metric.get("implied-volatility-index")),
-                'beta': self._safe_float(metric.get("beta")),
-                'liquidity_rating': self._safe_int(metric.get("liquidity-rating")),
-            }
-            
-            logger.info(f"Fetched Tastytrade metrics for {symbol}: IV Rank={result['iv_rank']}")
-            return result
-
+            items = _decode_items(response)
         except httpx.HTTPStatusError as e:
-            logger.error(f"Error fetching Tastytrade metrics for {symbol}: {e.response.status_code}")
-            return None
+            logger.error("Error fetching Tastytrade metrics for %s: %s", joined, e.response.status_code)
+            return {}
         except Exception as e:
-            logger.error(f"Error fetching Tastytrade metrics for {symbol}: {e}")
-            return None
+            logger.error("Error fetching Tastytrade metrics for %s: %s", joined, e)
+            return {}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for metric in items:
+            symbol = str(metric.get("symbol") or "").strip().upper()
+            if symbol not in symbols:
+                continue
+            results[symbol] = self._extract_market_metrics(metric)
+            logger.info("Fetched Tastytrade metrics for %s: IV Rank=%s", symbol, results[symbol]['iv_rank'])
+        return results
 
     def get_option_greeks(
         self,
@@ -508,23 +899,54 @@ class TastytradeClient:
         Returns:
             Dict with delta, gamma, theta, vega, rho, implied_volatility or None if unavailable
         """
-        if not self._ensure_token():
+        # Convert to OSI symbol format: "SYMBOL  YYMMDD(C/P)00000000".
+        # It is canonical per contract, so it doubles as the cache key.
+        cache_key = self._to_osi_symbol(symbol, expiration_date, strike, option_type)
+        if not cache_key:
+            logger.warning("Could not create OSI symbol for %s %s %s %s", symbol, strike, option_type, expiration_date)
             return None
 
         # Check cache first (5-minute cache for Greeks)
-        cache_key = f"greeks_{symbol}_{strike}_{expiration_date}_{option_type}"
         cached_data = self._get_cached_greeks(cache_key)
         if cached_data is not None:
-            logger.info(f"Greeks cache hit: {cache_key}")
+            logger.debug("Greeks cache hit: %s", cache_key)
             return cached_data
 
-        try:
-            # Convert to OSI symbol format: "SYMBOL  YYMMDD(C/P)00000000"
-            osi_symbol = self._to_osi_symbol(symbol, expiration_date, strike, option_type)
-            if not osi_symbol:
-                logger.warning(f"Could not create OSI symbol for {symbol} {strike} {option_type} {expiration_date}")
-                return None
+        # Cached quotes do not depend on the token; authenticate only on a miss.
+        if not self._ensure_token():
+            return None
+
+        with self._greeks_cache_lock:
+            # An owner may have cached the quote and retired its future since
+            # the check above; read again so this caller does not refetch it.
+            cached_data = self._get_memory_greeks_locked(cache_key)
+            if cached_data is not None:
+                return cached_data
+            future = self._greeks_inflight.get(cache_key)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                self._greeks_inflight[cache_key] = future
+
+        if not is_owner:
+            logger.debug("Joining in-flight Greeks request: %s", cache_key)
+            result = future.result()
+            return deepcopy(result) if result is not None else None
 
+        result = None
+        try:
+            result = self._fetch_option_greeks(symbol, cache_key)
+        finally:
+            with self._greeks_cache_lock:
+                self._greeks_inflight.pop(cache_key, None)
+            future.set_result(deepcopy(result) if result is not None else None)
+        return result
+
+    def _fetch_option_greeks(
+        self, symbol: str, osi_symbol: str
+    ) -> Optional[Dict[str, float]]:
+        """Fetch one contract's quote and cache it; callers coalesce on osi_symbol."""
+        try:
             # Fetch option quote from /market-data endpoint
             response = self._request(
                 "GET",
@@ -535,40 +957,23 @@ class TastytradeClient:
             )
             response.raise_for_status()
 
-            data = response.json()
-            items = data.get("data", {}).get("items", [])
+            items = _decode_items(response)
 
             if not items:
-                logger.warning(f"No quote data returned for {osi_symbol}")
+                logger.warning("No quote data returned for %s", osi_symbol)
                 return None
 
             option_data = items[0]
 
-            # Extract Greeks and pricing from API response
-            # Note: Tastytrade returns "volatility" which is actually implied volatility
-            # as a decimal (e.g., 0.8435 for 84.35% IV)
-            greeks = {
-                'delta': self._safe_float(option_data.get("delta")),
-                'gamma': self._safe_float(option_data.get("gamma")),
-                'theta': self._safe_float(option_data.get("theta")),
-                'vega': self._safe_float(option_data.get("vega")),
-                'rho': self._safe_float(option_data.get("rho")),
-                'implied_volatility': self._safe_float(option_data.get("volatility")),
-                # Also include pricing data
-                'bid': self._safe_float(option_data.get("bid")),
-                'ask': self._safe_float(option_data.get("ask")),
-                'mark': self._safe_float(option_data.get("mark")),
-                'last': self._safe_float(option_data.get("last")),
-                'theo_price': self._safe_float(option_data.get("theo-price")),
-            }
+            greeks = self._extract_greeks(option_data)
 
             # Validate we have at least some data
             if greeks['implied_volatility'] is None and greeks['delta'] is None:
-                logger.warning(f"No Greeks data available for {osi_symbol}")
+                logger.warning("No Greeks data available for %s", osi_symbol)
                 return None
 
             # Cache the result
-            self._cache_greeks(cache_key, greeks)
+            self._cache_greeks(osi_symbol, greeks)
             logger.debug(
                 "Fetched Greeks for %s: IV=%s, delta=%s",
                 osi_symbol,
@@ -578,11 +983,10 @@ class TastytradeClient:
             return greeks
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error fetching option Greeks for {symbol}: {e.response.status_code}")
+            logger.error("HTTP error fetching option Greeks for %s: %s", symbol, e.response.status_code)
             return None
         except Exception as e:
-            logger.error(f"Error fetching option Greeks for {symbol}: {e}")
-            import traceback
+            logger.error("Error fetching option Greeks for %s: %s", symbol, e)
             logger.debug(traceback.format_exc())
             return None
 
@@ -594,6 +998,8 @@ class TastytradeClient:
         Fetch Greeks for multiple options in a single batch API call.
 
         This is much more efficient than calling get_option_greeks multiple times.
+        Lookups are partial: cached contracts are answered locally and only the
+        misses are requested, so 40 hits out of 50 positions fetch 10 symbols.
 
         Args:
             positions: List of dicts with keys: symbol, strike, expiration_date, option_type
@@ -602,12 +1008,10 @@ class TastytradeClient:
             Dict mapping position_key -> Greeks dict
             position_key format: "{symbol}_{strike}_{expiration_date}_{option_type}"
         """
-        if not self._ensure_token():
-            return {}
-
         result = {}
-        osi_symbols = []
-        position_keys = []
+        # OSI symbol -> position keys awaiting it; duplicates share one fetch.
+        pending: Dict[str, list[str]] = {}
+        cached = 0
 
         # Build list of OSI symbols and check cache
         for pos in positions:
@@ -618,102 +1022,142 @@ class TastytradeClient:
 
             position_key = f"{symbol}_{strike}_{expiration_date}_{option_type}"
 
-            # Check cache first
-            cache_key = f"greeks_{symbol}_{strike}_{expiration_date}_{option_type}"
-            cached_data = self._get_cached_greeks(cache_key)
+            # The OSI symbol is both the request symbol and the cache key
+            osi_symbol = self._to_osi_symbol(symbol, expiration_date, strike, option_type)
+            if not osi_symbol:
+                continue
+
+            cached_data = self._get_cached_greeks(osi_symbol)
             if cached_data is not None:
                 result[position_key] = cached_data
-                logger.debug("Greeks cache hit: %s", position_key)
+                cached += 1
                 continue
 
-            # Create OSI symbol for API request
-            osi_symbol = self._to_osi_symbol(symbol, expiration_date, strike, option_type)
-            if osi_symbol:
-                osi_symbols.append(osi_symbol)
-                position_keys.append((position_key, symbol, strike, expiration_date, option_type))
+            pending.setdefault(osi_symbol, []).append(position_key)
 
-        if not osi_symbols:
+        if not pending:
             return result  # All results were from cache
 
+        if not self._ensure_token():
+            return result
+
         try:
             # Batch fetch - API accepts multiple symbols separated by commas
             # But the API has a limit, so we chunk if needed
-            chunk_size = 50  # API limit per request
-
-            for i in range(0, len(osi_symbols), chunk_size):
-                chunk = osi_symbols[i:i + chunk_size]
-                symbols_param = ','.join(chunk)
-
-                response = self._request(
-                    "GET",
-                    f"{TASTYTRADE_API_URL}/market-data",
-                    params={"symbols": symbols_param},
-                    headers={"Authorization": f"Bearer {self._access_token}"},
-                    timeout=30.0
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                items = data.get("data", {}).get("items", [])
-
-                # Map OSI symbols to their data
-                items_map = {item.get("symbol", ""): item for item in items}
-
-                # Process each position in this chunk
-                for j in range(len(chunk)):
-                    if i + j >= len(position_keys):
-                        break
-
-                    position_key, symbol, strike, expiration_date, option_type = position_keys[i + j]
-                    osi_symbol = chunk[j]
-
-                    if osi_symbol not in items_map:
-                        logger.warning(f"No quote data returned for {osi_symbol}")
+            osi_symbols = list(pending)
+            chunk_size = self._quote_chunk_size(osi_symbols)
+            chunk_starts = range(0, len(osi_symbols), chunk_size)
+            chunks = [osi_symbols[i:i + chunk_size] for i in chunk_starts]
+
+            # Chunks are independent, so overlap their round trips. The
+            # process-wide request semaphore still bounds actual concurrency.
+            if len(chunks) == 1:
+                chunk_items = [self._fetch_quote_chunk(chunks[0])]
+            else:
+                futures = [
+                    _QUOTE_EXECUTOR.submit(self._fetch_quote_chunk, chunk)
+                    for chunk in chunks
+                ]
+                # Merge chunks as they land; pending makes order irrelevant.
+                chunk_items = (future.result() for future in as_completed(futures))
+
+            debug = logger.isEnabledFor(logging.DEBUG)
+            fetched = 0
+            for items_map in chunk_items:
+                if not items_map:
+                    continue
+
+                # Walk the quotes that came back; anything else is missing
+                for osi_symbol, option_data in items_map.items():
+                    waiting = pending.get(osi_symbol)
+                    if waiting is None:
                         continue
 
-                    option_data = items_map[osi_symbol]
-
-                    greeks = {
-                        'delta': self._safe_float(option_data.get("delta")),
-                        'gamma': self._safe_float(option_data.get("gamma")),
-                        'theta': self._safe_float(option_data.get("theta")),
-                        'vega': self._safe_float(option_data.get("vega")),
-                        'rho': self._safe_float(option_data.get("rho")),
-                        'implied_volatility': self._safe_float(option_data.get("volatility")),
-                        'bid': self._safe_float(option_data.get("bid")),
-                        'ask': self._safe_float(option_data.get("ask")),
-                        'mark': self._safe_float(option_data.get("mark")),
-                        'last': self._safe_float(option_data.get("last")),
-                        'theo_price': self._safe_float(option_data.get("theo-price")),
-                    }
+                    greeks = self._extract_greeks(option_data)
 
                     if greeks['implied_volatility'] is None and greeks['delta'] is None:
-                        logger.warning(f"No Greeks data available for {osi_symbol}")
+                        if debug:
+                            logger.debug("No Greeks data available for %s", osi_symbol)
                         continue
 
                     # Cache the result
-                    cache_key = f"greeks_{symbol}_{strike}_{expiration_date}_{option_type}"
-                    self._cache_greeks(cache_key, greeks)
-
-                    result[position_key] = greeks
-                    logger.debug(
-                        "Fetched Greeks for %s: IV=%s, delta=%s",
-                        osi_symbol,
-                        greeks["implied_volatility"],
-                        greeks["delta"],
-                    )
+                    self._cache_greeks(osi_symbol, greeks)
+                    fetched += 1
+
+                    result[waiting[0]] = greeks
+                    for position_key in waiting[1:]:
+                        result[position_key] = dict(greeks)
+                    if debug:
+                        logger.debug(
+                            "Fetched Greeks for %s: IV=%s, delta=%s",
+                            osi_symbol,
+                            greeks["implied_volatility"],
+                            greeks["delta"],
+                        )
 
+            missing = len(osi_symbols) - fetched
+            # One summary line per batch instead of one line per contract.
+            log = logger.warning if missing and missing == len(osi_symbols) else logger.info
+            log(
+                "Greeks batch: %d fetched, %d cached, %d missing",
+                fetched,
+                cached,
+                missing,
+            )
             return result
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error fetching batch option Greeks: {e.response.status_code}")
-            return result
         except Exception as e:
-            logger.error(f"Error fetching batch option Greeks: {e}")
-            import traceback
+            logger.error("Error fetching batch option Greeks: %s", e)
             logger.debug(traceback.format_exc())
             return result
 
+    def _quote_chunk_size(self, osi_symbols: list[str]) -> int:
+        """Symbols per request: the configured cap, shrunk to fit the URL budget."""
+        # OSI symbols pad with spaces, which encode as %20; the comma as %2C.
+        encoded_length = max(
+            len(quote(symbol)) + 3 for symbol in osi_symbols
+        )
+        return max(
+            1,
+            min(
+                self._quote_chunk_max_symbols,
+                QUOTE_QUERY_BUDGET_BYTES // encoded_length,
+            ),
+        )
+
+    def _fetch_quote_chunk(
+        self, chunk: list[str]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Fetch one /market-data chunk, mapping OSI symbol -> projected quote."""
+        try:
+            response = self._request(
+                "GET",
+                f"{TASTYTRADE_API_URL}/market-data",
+                params={"symbols": ",".join(chunk)},
+                headers={"Authorization": f"Bearer {self._access_token}"},
+                timeout=30.0
+            )
+            response.raise_for_status()
+
+            # Keep only the fields we read, so chunks held while their
+            # siblings finish do not pin the full ~30-field quote items.
+            # Quote fields stay .get(): illiquid contracts omit Greeks.
+            quotes: Dict[str, Dict[str, Any]] = {}
+            for item in _decode_items(response):
+                symbol = item.get("symbol")
+                if symbol:
+                    get = item.get
+                    quotes[symbol] = {field: get(field) for field in _QUOTE_FIELDS}
+            return quotes
+
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error fetching batch option Greeks: %s", e.response.status_code)
+            return None
+        except Exception as e:
+            logger.error("Error fetching batch option Greeks: %s", e)
+            logger.debug(traceback.format_exc())
+            return None
+
     def _to_osi_symbol(
         self,
         symbol: str,
@@ -744,25 +1188,19 @@ class TastytradeClient:
             OSI symbol string or None if parsing fails
         """
         try:
-            # Parse expiration date
-            from datetime import datetime
-            exp = datetime.strptime(expiration_date, "%Y-%m-%d")
+            exp_part = _osi_expiration(expiration_date)
 
-            # Format parts
-            symbol_part = symbol.upper().ljust(6)[:6]  # Left-align, pad with spaces, max 6 chars
-            year_part = exp.strftime("%y")  # Last 2 digits of year
-            month_day = exp.strftime("%m%d")  # MMDD
-            type_part = option_type.upper()
+            # Left-align, pad with spaces, max 6 chars
+            symbol_part = symbol.upper().ljust(6)[:6]
 
             # Format strike as 8 digits (no decimal)
             # Multiply by 1000 to handle fractional strikes, then format as int
             strike_int = int(round(strike * 1000))
-            strike_part = f"{strike_int:08d}"
 
-            return f"{symbol_part}{year_part}{month_day}{type_part}{strike_part}"
+            return f"{symbol_part}{exp_part}{option_type.upper()}{strike_int:08d}"
 
         except Exception as e:
-            logger.error(f"Error creating OSI symbol: {e}")
+            logger.error("Error creating OSI symbol: %s", e)
             return None
 
     def search_symbols(self, query: str) -> list:
@@ -775,9 +1213,33 @@ class TastytradeClient:
         Returns:
             List of matching symbols with metadata
         """
+        # Autocomplete repeats the same prefixes within seconds; misses and
+        # fallback answers are cached too so they do not refetch per keystroke.
+        cache_key = query.strip().upper()
+        now = time.monotonic()
+        with self._search_cache_lock:
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                cached_at, cached_results = cached
+                if now - cached_at < self._search_cache_ttl_seconds:
+                    self._search_cache.move_to_end(cache_key)
+                    return deepcopy(cached_results)
+                del self._search_cache[cache_key]
+
+        results = self._fetch_symbol_search(query)
+
+        with self._search_cache_lock:
+            self._search_cache[cache_key] = (time.monotonic(), deepcopy(results))
+            self._search_cache.move_to_end(cache_key)
+            while len(self._search_cache) > self._search_cache_max_entries:
+                self._search_cache.popitem(last=False)
+        return results
+
+    def _fetch_symbol_search(self, query: str) -> list:
+        """Query Tastytrade symbol search, falling back to Yahoo Finance."""
         if not self._ensure_token():
             # Fallback: If Tastytrade not configured, use Yahoo Finance to validate
-            logger.info(f"Tastytrade not configured, using Yahoo Finance fallback for: {query}")
+            logger.info("Tastytrade not configured, using Yahoo Finance fallback for: %s", query)
             return self._search_symbols_fallback(query)
 
         try:
@@ -785,12 +1247,10 @@ class TastytradeClient:
                 "GET",
                 f"{TASTYTRADE_API_URL}/symbols/search/{query}",
                 headers={"Authorization": f"Bearer {self._access_token}"},
-                timeout=10.0
             )
             response.raise_for_status()
 
-            data = response.json()
-            items = data.get("data", {}).get("items", [])
+            items = _decode_items(response)
 
             results = []
             for item in items:
@@ -809,46 +1269,47 @@ class TastytradeClient:
             return results
 
         except Exception as e:
-            logger.error(f"Error searching symbols via Tastytrade: {e}, falling back to Yahoo Finance")
+            logger.error("Error searching symbols via Tastytrade: %s, falling back to Yahoo Finance", e)
             return self._search_symbols_fallback(query)
 
     def _search_symbols_fallback(self, query: str) -> list:
         """
-        Fallback symbol search using Yahoo Finance validation.
+        Fallback symbol search using Yahoo Finance's search endpoint.
 
         This is used when Tastytrade is unavailable or returns no results.
         """
-        import yfinance as yf
-
         if not query or len(query.strip()) < 1:
             return []
 
         query_upper = query.strip().upper()
 
         try:
-            # Try to fetch info for the exact symbol from Yahoo Finance
-            ticker = yf.Ticker(query_upper)
-            info = ticker.info
-
-            # Check if this is a valid ticker (has a quote type)
-            if info and info.get('quoteType'):
-                quote_type = info.get('quoteType', '')
-                long_name = info.get('longName', info.get('shortName', query_upper))
-
-                # Only return if it's a stock or ETF
-                if quote_type in ['EQUITY', 'ETF']:
-                    return [{
-                        "symbol": query_upper,
-                        "name": long_name,
-                        "exchange": info.get('exchange', 'Unknown'),
-                        "type": quote_type
-                    }]
-
-            logger.info(f"No valid ticker found for: {query_upper}")
-            return []
+            # One small JSON request over the shared connection pool.
+            response = self._http_client.request(
+                "GET",
+                YAHOO_SEARCH_URL,
+                params={"q": query_upper, "quotesCount": 5, "newsCount": 0},
+                headers={"User-Agent": "Mozilla/5.0"},
+                timeout=5.0,
+            )
+            response.raise_for_status()
+
+            results = [
+                {
+                    "symbol": item["symbol"],
+                    "name": item.get("longname") or item.get("shortname") or item["symbol"],
+                    "exchange": item.get("exchDisp") or item.get("exchange") or "Unknown",
+                    "type": item["quoteType"],
+                }
+                for item in _decode_json(response).get("quotes", [])
+                if item.get("symbol") and item.get("quoteType") in YAHOO_SEARCH_QUOTE_TYPES
+            ]
+            if not results:
+                logger.info("No valid ticker found for: %s", query_upper)
+            return results
 
         except Exception as e:
-            logger.warning(f"Yahoo Finance fallback search failed for {query}: {e}")
+            logger.warning("Yahoo Finance fallback search failed for %s: %s", query, e)
             # If even Yahoo Finance fails, return the symbol anyway to let user proceed
             # Market data fetch will validate it later
             return [{
@@ -870,8 +1331,6 @@ class TastytradeClient:
         Returns:
             List of strike prices
         """
-        from datetime import datetime
-
         # Determine strike interval based on price
         if current_price < 50:
             interval = 2.5
@@ -885,13 +1344,11 @@ class TastytradeClient:
         min_strike = current_price * 0.5
         max_strike = current_price * 1.5
 
-        strikes = []
-        current = round(min_strike / interval) * interval
-        while current <= max_strike:
-            strikes.append(round(current, 1))
-            current += interval
-
-        return strikes
+        # Multiply instead of accumulating so 2.5-wide ladders do not drift;
+        # the epsilon keeps max_strike itself when it lands on a step.
+        first = float(round(min_strike / interval) * interval)
+        count = max(0, math.floor((max_strike - first) / interval + 1e-9) + 1)
+        return np.round(first + np.arange(count) * interval, 1).tolist()
 
     def get_option_chain(
         self, symbol: str, current_price: float | None = None
@@ -902,6 +1359,9 @@ class TastytradeClient:
 
         with self._option_chain_cache_lock:
             cached = self._option_chain_cache.get(cache_key)
+            # Once this process has held the chain, an expired entry is
+            # refetched (and revalidated by ETag); disk only serves cold starts.
+            warm = cached is not None or cache_key in self._option_chain_validators
             if cached is not None:
                 cached_at, cached_result = cached
                 if now - cached_at < self._option_chain_cache_ttl_seconds:
@@ -918,12 +1378,34 @@ class TastytradeClient:
         if not is_owner:
             return deepcopy(future.result())
 
-        result = self._fetch_option_chain(cache_key, current_price)
+        result = None
+        cached_at = None
+        if self._disk_cache is not None and not warm:
+            entry = self._disk_cache.get_entry("option_chain", cache_key)
+            if entry is not None:
+                persisted, remaining = entry
+                # Only the listing is persisted; a day-old spot price is not
+                result = {**persisted, "underlying_price": None}
+                cached_at = self._promoted_at(
+                    remaining, self._option_chain_cache_ttl_seconds
+                )
+        if result is None:
+            result = self._fetch_option_chain(cache_key, current_price)
+            if self._disk_cache is not None and result.get("expirations"):
+                self._disk_cache.set(
+                    "option_chain",
+                    cache_key,
+                    {
+                        "expirations": result["expirations"],
+                        "strikes_by_expiration": result["strikes_by_expiration"],
+                    },
+                    self._disk_option_chain_ttl_seconds,
+                )
 
         with self._option_chain_cache_lock:
             if result.get("expirations"):
                 self._option_chain_cache[cache_key] = (
-                    time.monotonic(),
+                    time.monotonic() if cached_at is None else cached_at,
                     deepcopy(result),
                 )
                 self._option_chain_cache.move_to_end(cache_key)
@@ -937,6 +1419,19 @@ class TastytradeClient:
 
         return deepcopy(result)
 
+    def _remember_option_chain_validator(
+        self, symbol: str, etag: str, result: Dict[str, Any]
+    ) -> None:
+        """Keep a bounded ETag -> body map so expired chains revalidate with a 304."""
+        with self._option_chain_cache_lock:
+            self._option_chain_validators[symbol] = (etag, deepcopy(result))
+            self._option_chain_validators.move_to_end(symbol)
+            while (
+                len(self._option_chain_validators)
+                > self._option_chain_cache_max_entries
+            ):
+                self._option_chain_validators.popitem(last=False)
+
     def _fetch_option_chain(
         self, symbol: str, current_price: float | None = None
     ) -> Dict[str, Any]:
@@ -959,13 +1454,23 @@ class TastytradeClient:
             # The documented nested endpoint returns expirations and strikes in
             # one response. This replaces the former /expirations + /strikes
             # calls, which are not part of the current API surface.
+            headers = {"Authorization": f"Bearer {self._access_token}"}
+            with self._option_chain_cache_lock:
+                validator = self._option_chain_validators.get(symbol)
+            if validator is not None:
+                headers["If-None-Match"] = validator[0]
+
             response = self._request(
                 "GET",
                 f"{TASTYTRADE_API_URL}/option-chains/{symbol}/nested",
-                headers={"Authorization": f"Bearer {self._access_token}"},
+                headers=headers,
                 timeout=20.0,
             )
 
+            if response.status_code == 304 and validator is not None:
+                logger.debug("Option chain for %s not modified", symbol)
+                return deepcopy(validator[1])
+
             if response.status_code == 404:
                 logger.warning("No option chain found for %s", symbol)
                 return {
@@ -975,7 +1480,7 @@ class TastytradeClient:
                 }
 
             response.raise_for_status()
-            data = response.json().get("data", {})
+            data = _decode_json(response).get("data", {})
             chain_items = data.get("items", [])
             if isinstance(chain_items, dict):
                 chain_items = [chain_items]
@@ -995,19 +1500,8 @@ class TastytradeClient:
                     raw_expiration = str(
                         expiration_item.get("expiration-date", "")
                     )
-                    try:
-                        if "T" in raw_expiration:
-                            expiration_date = datetime.fromisoformat(
-                                raw_expiration.replace("Z", "+00:00").replace(
-                                    "+0000", "+00:00"
-                                )
-                            )
-                        else:
-                            expiration_date = datetime.strptime(
-                                raw_expiration, "%Y-%m-%d"
-                            )
-                        expiration = expiration_date.strftime("%Y-%m-%d")
-                    except (TypeError, ValueError):
+                    expiration = _normalize_expiration(raw_expiration)
+                    if expiration is None:
                         logger.warning(
                             "Could not parse expiration date %s", raw_expiration
                         )
@@ -1022,7 +1516,7 @@ class TastytradeClient:
                             if isinstance(strike_item, dict)
                             else strike_item
                         )
-                        strike = self._safe_float(raw_strike)
+                        strike = self._as_float(raw_strike)
                         if strike is not None:
                             expiration_strikes.append(strike)
 
@@ -1045,18 +1539,21 @@ class TastytradeClient:
                 sum(len(strikes) for strikes in strikes_by_expiration.values()),
             )
 
-            return {
+            result = {
                 "expirations": expirations,
                 "strikes_by_expiration": strikes_by_expiration,
                 "underlying_price": underlying_price,
             }
+            etag = response.headers.get("ETag")
+            if etag:
+                self._remember_option_chain_validator(symbol, etag, result)
+            return result
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error fetching option chain for {symbol}: {e.response.status_code}")
+            logger.error("HTTP error fetching option chain for %s: %s", symbol, e.response.status_code)
             return {"expirations": [], "strikes_by_expiration": {}, "underlying_price": None}
         except Exception as e:
-            logger.error(f"Error fetching option chain for {symbol}: {e}")
-            import traceback
+            logger.error("Error fetching option chain for %s: %s", symbol, e)
             logger.debug(traceback.format_exc())
             return {"expirations": [], "strikes_by_expiration": {}, "underlying_price": None}
 
@@ -1182,32 +1679,26 @@ class TastytradeClient:
             filtered_strikes = self._generate_strikes_around_price(current_price)
 
             if not filtered_strikes:
-                logger.warning(f"Could not generate strikes for {symbol} at price {current_price}")
+                logger.warning("Could not generate strikes for %s at price %s", symbol, current_price)
                 return self._empty_volatility_smile(current_price)
 
-            # Build positions list for batch fetch
-            positions = []
-            for strike in filtered_strikes:
-                positions.append({
+            # Build positions list for batch fetch, a call and a put per strike
+            positions = [
+                {
                     "symbol": symbol,
                     "strike": strike,
                     "expiration_date": expiration,
-                    "option_type": "C"
-                })
-                positions.append({
-                    "symbol": symbol,
-                    "strike": strike,
-                    "expiration_date": expiration,
-                    "option_type": "P"
-                })
+                    "option_type": option_type,
+                }
+                for strike in filtered_strikes
+                for option_type in ("C", "P")
+            ]
 
             # Batch fetch all Greeks
             greeks_data = self.get_batch_option_greeks(positions)
 
             # Build smile data points
             points = []
-            atm_iv = 0
-            nearest_distance = float('inf')
 
             for strike in filtered_strikes:
                 call_key = f"{symbol}_{strike}_{expiration}_C"
@@ -1216,7 +1707,7 @@ class TastytradeClient:
                 call_data = greeks_data.get(call_key)
                 put_data = greeks_data.get(put_key)
 
-                point = {
+                points.append({
                     "strike": strike,
                     "call_iv": call_data.get("implied_volatility") if call_data else None,
                     "put_iv": put_data.get("implied_volatility") if put_data else None,
@@ -1226,31 +1717,24 @@ class TastytradeClient:
                     "call_ask": call_data.get("ask") if call_data else None,
                     "put_bid": put_data.get("bid") if put_data else None,
                     "put_ask": put_data.get("ask") if put_data else None,
-                }
+                })
 
-                # Track ATM IV (nearest strike to current price)
-                distance = abs(strike - current_price)
-                if distance < nearest_distance:
-                    nearest_distance = distance
-                    # Use average of call and put IV at ATM
-                    call_iv = point["call_iv"] or 0
-                    put_iv = point["put_iv"] or 0
-                    if call_iv and put_iv:
-                        atm_iv = (call_iv + put_iv) / 2
-                    elif call_iv:
-                        atm_iv = call_iv
-                    elif put_iv:
-                        atm_iv = put_iv
-
-                points.append(point)
+            atm_iv = self._atm_iv(points, current_price)
 
             skew_summary = summarize_volatility_skew(points, current_price)
             has_quotes = self._is_cacheable_volatility_smile({"points": points})
             data_status = "ok" if has_quotes else "no_quotes"
 
-            logger.info(f"Fetched volatility smile for {symbol} {expiration}: "
-                       f"{len(points)} strikes, ATM IV={atm_iv:.2%}, "
-                       f"Skew={skew_summary['skew_metric']} ({skew_summary['skew_basis']})")
+            logger.info(
+                "Fetched volatility smile for %s %s: %d strikes, ATM IV=%.2f%%, "
+                "Skew=%s (%s)",
+                symbol,
+                expiration,
+                len(points),
+                atm_iv * 100,
+                skew_summary['skew_metric'],
+                skew_summary['skew_basis'],
+            )
 
             return {
                 "points": points,
@@ -1260,12 +1744,61 @@ class TastytradeClient:
             }
 
         except Exception as e:
-            logger.error(f"Error fetching volatility smile for {symbol}: {e}")
-            import traceback
+            logger.error("Error fetching volatility smile for %s: %s", symbol, e)
             logger.debug(traceback.format_exc())
             return self._empty_volatility_smile(current_price)
 
-    def _safe_float(self, value: Any, divide_by: float = 1, multiply_by: float = 1) -> Optional[float]:
+    @staticmethod
+    def _atm_iv(points: list[Dict[str, Any]], current_price: float) -> float:
+        """Average call/put IV at the quoted strike nearest spot, or 0 if none."""
+        call_iv = np.array(
+            [point["call_iv"] or np.nan for point in points], dtype=np.float64
+        )
+        put_iv = np.array(
+            [point["put_iv"] or np.nan for point in points], dtype=np.float64
+        )
+        strikes = np.array([point["strike"] for point in points], dtype=np.float64)
+
+        distance = np.where(
+            np.isnan(call_iv) & np.isnan(put_iv),
+            np.inf,
+            np.abs(strikes - current_price),
+        )
+        if not len(distance) or np.isinf(distance.min()):
+            return 0
+        # nanmean of the pair falls back to whichever side is quoted.
+        atm_index = int(distance.argmin())
+        return float(np.nanmean([call_iv[atm_index], put_iv[atm_index]]))
+
+    @staticmethod
+    def _as_float(value: Any) -> Optional[float]:
+        """_safe_float without scaling; floats and None pass straight through."""
+        if value is None or type(value) is float:
+            return value
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _extract_greeks(self, quote: Dict[str, Any]) -> Dict[str, Optional[float]]:
+        """Map a /market-data quote to the Greeks/pricing dict via _GREEK_FIELDS."""
+        as_float = self._as_float
+        get = quote.get
+        return {key: as_float(get(api_field)) for key, api_field in _GREEK_FIELDS}
+
+    def _extract_market_metrics(self, metric: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a /market-metrics item to the metrics dict via _METRIC_FIELDS."""
+        as_float = self._as_float
+        get = metric.get
+        result: Dict[str, Any] = {}
+        for key, api_field, scale in _METRIC_FIELDS:
+            value = as_float(get(api_field))
+            result[key] = value * scale if value is not None else None
+        result["liquidity_rating"] = self._safe_int(get("liquidity-rating"))
+        return result
+
+    @staticmethod
+    def _safe_float(value: Any, divide_by: float = 1, multiply_by: float = 1) -> Optional[float]:
         """Safely convert value to float with optional scaling"""
         if value is None:
             return None
@@ -1274,7 +1807,8 @@ class TastytradeClient:
         except (TypeError, ValueError):
             return None
 
-    def _safe_int(self, value: Any) -> Optional[int]:
+    @staticmethod
+    def _safe_int(value: Any) -> Optional[int]:
         """Safely convert value to int"""
         if value is None:
             return None
@@ -2,15 +2,23 @@
 Tests for Black-Scholes pricing and Greeks calculations
 """
 
+import math
 import pytest
 from datetime import date
+import calculator
 from calculator import (
+    BSContext,
+    OptType,
     calculate_black_scholes_price,
     calculate_option_greeks,
     calculate_intrinsic_value,
-    calculate_pl
+    calculate_intrinsic_values,
+    calculate_black_scholes_prices,
+    calculate_price_and_greeks,
+    calculate_pl,
+    _binomial_both
 )
-from market_data import calculate_days_to_expiration, MarketDataFetcher
+from market_data import calculate_days_to_expiration, parse_expiration_date, MarketDataFetcher
 
 
 class TestBlackScholesPricing:
@@ -76,6 +84,61 @@ class TestBlackScholesPricing:
         high_vol = calculate_black_scholes_price('C', 100, 100, 30, 0.05, 0.30)
         assert high_vol > low_vol, "Higher IV option should be more valuable"
 
+    @pytest.mark.parametrize("option_style", ["European", "American"])
+    @pytest.mark.parametrize("days_to_expiration", [0, 45])
+    def test_vectorized_prices_match_scalar_pricing(self, option_style, days_to_expiration):
+        """Grid pricing should agree with per-price Black-Scholes calls"""
+        stock_prices = [70.0, 95.5, 100.0, 104.0, 150.0]
+        for option_type in ('C', 'P'):
+            grid = calculate_black_scholes_prices(
+                option_type, stock_prices, 100, days_to_expiration, 0.05, 0.3, 0.01, option_style
+            )
+            expected = [
+                calculate_black_scholes_price(
+                    option_type, s, 100, days_to_expiration, 0.05, 0.3, 0.01, option_style
+                )
+                for s in stock_prices
+            ]
+            assert grid.tolist() == pytest.approx(expected, rel=1e-10, abs=1e-10)
+
+    def test_shared_context_matches_per_call_pricing(self):
+        """One BSContext reused across strikes should price like independent calls"""
+        ctx = BSContext.from_days(30, 0.045, 0.01)
+        for option_type in ('C', 'P'):
+            for strike in (80, 95, 100, 105, 120):
+                expected = calculate_black_scholes_price(option_type, 100, strike, 30, 0.045, 0.25, 0.01)
+                price = calculate_black_scholes_prices(option_type, [100.0], strike, 30, 0.045, 0.25, 0.01, ctx=ctx)[0]
+                assert price == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+        with pytest.raises(ValueError):
+            calculate_black_scholes_prices('C', [100.0], 100, 45, 0.045, 0.25, 0.01, ctx=ctx)
+
+    @pytest.mark.parametrize("stock_price, days_to_expiration", [
+        (100.0, 1),   # ATM, one day left
+        (150.0, 1),   # deep ITM call / deep OTM put, one day left
+        (60.0, 2),    # deep ITM put, two days left
+        (150.0, 365),
+    ])
+    def test_vectorized_prices_hold_at_short_dte_and_deep_itm(self, stock_price, days_to_expiration):
+        """Grid pricing stays on the scalar path and put-call parity where theta diverges"""
+        args = ([stock_price], 100, days_to_expiration, 0.05, 0.3, 0.01)
+        call = calculate_black_scholes_prices('C', *args)[0]
+        put = calculate_black_scholes_prices('P', *args)[0]
+
+        assert call == pytest.approx(calculate_black_scholes_price('C', stock_price, *args[1:]), rel=1e-10, abs=1e-12)
+        assert put == pytest.approx(calculate_black_scholes_price('P', stock_price, *args[1:]), rel=1e-10, abs=1e-12)
+
+        t = days_to_expiration / 365.0
+        parity = stock_price * math.exp(-0.01 * t) - 100 * math.exp(-0.05 * t)
+        assert call - put == pytest.approx(parity, abs=1e-9)
+
+    def test_vectorized_prices_match_textbook_values(self):
+        """Hull's S=42, K=40, r=10%, vol=20%, T=0.5 example: call 4.76, put 0.81"""
+        call = calculate_black_scholes_prices('C', [42.0], 40, 182.5, 0.10, 0.20)[0]
+        put = calculate_black_scholes_prices('P', [42.0], 40, 182.5, 0.10, 0.20)[0]
+        assert call == pytest.approx(4.7594, abs=1e-4)
+        assert put == pytest.approx(0.8086, abs=1e-4)
+
 
 class TestGreeksCalculation:
     """Tests for option Greeks calculations"""
@@ -134,6 +197,17 @@ class TestGreeksCalculation:
         greeks = calculate_option_greeks('C', 80, 100, 30, 0.05, 0.20)
         assert greeks['delta'] < 0.3, f"Deep OTM call delta {greeks['delta']} should be < 0.3"
 
+    @pytest.mark.parametrize("option_type", ['C', 'P'])
+    @pytest.mark.parametrize("stock_price", [90, 100, 115])
+    def test_combined_price_and_greeks_match_separate_calls(self, option_type, stock_price):
+        """Shared d1/d2 path should reproduce the separate price and Greeks results"""
+        args = (option_type, stock_price, 100, 30, 0.045, 0.25, 0.01)
+
+        price, greeks = calculate_price_and_greeks(*args)
+
+        assert price == pytest.approx(calculate_black_scholes_price(*args), rel=1e-12, abs=1e-12)
+        assert greeks == pytest.approx(calculate_option_greeks(*args), rel=1e-12, abs=1e-12)
+
 
 class TestIntrinsicValue:
     """Tests for intrinsic value calculations"""
@@ -158,6 +232,17 @@ class TestIntrinsicValue:
         value = calculate_intrinsic_value('P', 110, 100)
         assert value == 0.0, f"OTM put intrinsic value should be 0, got {value}"
 
+    @pytest.mark.parametrize("flag, opt_type", [('C', OptType.CALL), ('p', OptType.PUT)])
+    def test_vectorized_values_accept_flag_or_enum(self, flag, opt_type):
+        """String flags and OptType signs give the same grid values as the scalar API"""
+        stock_prices = [80.0, 100.0, 120.0]
+        expected = [calculate_intrinsic_value(flag, s, 100) for s in stock_prices]
+
+        assert calculate_intrinsic_values(flag, stock_prices, 100).tolist() == expected
+        assert calculate_intrinsic_values(opt_type, stock_prices, 100).tolist() == expected
+        assert (calculate_black_scholes_prices(opt_type, stock_prices, 100, 30, 0.05, 0.2).tolist()
+                == calculate_black_scholes_prices(flag, stock_prices, 100, 30, 0.05, 0.2).tolist())
+
 
 class TestDaysToExpiration:
     """Tests for expiration date parsing"""
@@ -193,6 +278,7 @@ class TestDaysToExpiration:
 class TestCalculatePLIntegration:
     """Integration tests for full P/L calculation with Black-Scholes"""
 
+    @pytest.mark.slow
     def test_calculate_pl_with_market_data(self):
         """Test P/L calculation with Black-Scholes pricing"""
         positions = [
@@ -260,6 +346,7 @@ class TestCalculatePLIntegration:
         assert result['positions_with_greeks'] is None, "Should not have Greeks without market data"
         assert result['portfolio_greeks'] is None, "Should not have portfolio Greeks without market data"
 
+    @pytest.mark.slow
     def test_calculate_pl_short_strangle(self):
         """Test P/L for a short strangle strategy"""
         positions = [
@@ -291,6 +378,7 @@ class TestCalculatePLIntegration:
         portfolio_theta = result['portfolio_greeks']['theta']
         assert portfolio_theta > 0, f"Short strangle should have positive theta, got {portfolio_theta}"
 
+    @pytest.mark.slow
     def test_calculate_pl_long_call(self):
         """Test P/L for a simple long call"""
         positions = [
@@ -345,6 +433,15 @@ class TestMarketDataFetcher:
         parsed = fetcher.parse_expiration_date("3/21/2025", reference)
         assert parsed == date(2025, 3, 21), "Failed to parse US format"
 
+    def test_cached_parse_stays_relative_to_reference_date(self):
+        """Repeated parses are cached per reference date, not shared across years"""
+        assert parse_expiration_date(" Jan 16", date(2025, 1, 1)) == date(2025, 1, 16)
+        assert parse_expiration_date("Jan 16", date(2025, 3, 1)) == date(2026, 1, 16)
+        assert parse_expiration_date("Jan 16", date(2025, 1, 1)) == date(2025, 1, 16)
+
+        with pytest.raises(ValueError):
+            parse_expiration_date("not a date", date(2025, 1, 1))
+
     def test_default_risk_free_rate(self):
         """Test that default risk-free rate is reasonable"""
         fetcher = MarketDataFetcher()
@@ -352,31 +449,19 @@ class TestMarketDataFetcher:
         assert 0.0 < rate < 0.2, f"Risk-free rate {rate} seems unreasonable"
 
 
+@pytest.fixture(scope="module")
+def deep_itm_put_prices():
+    """European and American prices of a deep ITM put from one binomial tree"""
+    return _binomial_both('P', 80, 100, 60, 0.10, 0.30)
+
+
 class TestAmericanOptions:
     """Tests for American option pricing"""
 
-    def test_american_put_higher_than_european_put(self):
+    def test_american_put_higher_than_european_put(self, deep_itm_put_prices):
         """American put should be worth more than European put due to early exercise"""
         # Deep ITM put with high risk-free rate
-        european_price = calculate_black_scholes_price(
-            option_type='P',
-            stock_price=80,
-            strike=100,
-            days_to_expiration=60,
-            risk_free_rate=0.10,
-            implied_volatility=0.30,
-            option_style="European"
-        )
-
-        american_price = calculate_black_scholes_price(
-            option_type='P',
-            stock_price=80,
-            strike=100,
-            days_to_expiration=60,
-            risk_free_rate=0.10,
-            implied_volatility=0.30,
-            option_style="American"
-        )
+        european_price, american_price = deep_itm_put_prices
 
         # American put should be worth at least as much as European put
         assert american_price >= european_price, \
@@ -388,32 +473,37 @@ class TestAmericanOptions:
 
     def test_american_call_no_dividend_equals_european(self):
         """American call on non-dividend stock should equal European call"""
-        european_price = calculate_black_scholes_price(
+        european_price, american_price = _binomial_both(
             option_type='C',
             stock_price=100,
             strike=100,
             days_to_expiration=30,
             risk_free_rate=0.05,
             implied_volatility=0.20,
-            dividend_yield=0.0,
-            option_style="European"
-        )
-
-        american_price = calculate_black_scholes_price(
-            option_type='C',
-            stock_price=100,
-            strike=100,
-            days_to_expiration=30,
-            risk_free_rate=0.05,
-            implied_volatility=0.20,
-            dividend_yield=0.0,
-            option_style="American"
+            dividend_yield=0.0
         )
 
         # Should be very close (within 1%)
         assert abs(american_price - european_price) / european_price < 0.01, \
             f"American call ({american_price}) should ≈ European call ({european_price}) with no dividends"
 
+    def test_single_tree_prices_both_styles(self, deep_itm_put_prices):
+        """One lattice roll-back should yield the European and American prices"""
+        args = ('P', 80, 100, 60, 0.10, 0.30)
+        european_price, american_price = deep_itm_put_prices
+
+        assert american_price == calculate_black_scholes_price(*args, option_style="American")
+        assert european_price == pytest.approx(calculate_black_scholes_price(*args), rel=0.01)
+
+    def test_single_tree_falls_back_to_intrinsic_on_error(self, monkeypatch):
+        """A failing roll-back should price both styles at intrinsic value"""
+        def failing_rollback(*args, **kwargs):
+            raise FloatingPointError("overflow")
+
+        monkeypatch.setattr(calculator, "_binomial_rollback", failing_rollback)
+
+        assert _binomial_both('P', 80, 100, 60, 0.10, 0.30) == (20.0, 20.0)
+
     def test_american_greeks_calculation(self):
         """Test that American Greeks can be calculated"""
         greeks = calculate_option_greeks(
@@ -447,6 +537,7 @@ class TestAmericanOptions:
         # Vega should be positive
         assert greeks['vega'] > 0, "Vega should be positive for long options"
 
+    @pytest.mark.slow
     def test_american_vs_european_integration(self):
         """Test calculate_pl with American options"""
         positions = [
@@ -1,78 +1,93 @@
+import asyncio
+import json
+
 import pytest
-from fastapi.testclient import TestClient
 import image_parser
-from main import app
 
 
-client = TestClient(app)
+UPLOAD_IMAGE_FILES = {"file": ("positions.png", b"image", "image/png")}
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _json_body(payload) -> bytes:
+    """Serialize a request payload once, at import, for content= posts."""
+    return json.dumps(payload).encode()
+
+
+def _preflight(middleware, path, headers):
+    """Drive a CORS preflight straight through the middleware and return its headers."""
+    scope = {
+        "type": "http",
+        "method": "OPTIONS",
+        "path": path,
+        "query_string": b"",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    return {name.decode().lower(): value.decode() for name, value in start["headers"]}
+
+
+@pytest.fixture(scope="module")
+def cors_middleware():
+    """The app's own CORSMiddleware configuration around a stub ASGI app."""
+    from starlette.middleware.cors import CORSMiddleware
+    from main import app
+
+    async def downstream(scope, receive, send):
+        raise AssertionError("CORS preflight should not reach the application")
+
+    spec = next(m for m in app.user_middleware if m.cls is CORSMiddleware)
+    return CORSMiddleware(downstream, *spec.args, **spec.kwargs)
 
 
 class TestCORSConfiguration:
     """Tests for CORS configuration (Fix #3)"""
 
-    def test_cors_allows_valid_origin(self):
-        """CORS should allow configured origins"""
-        response = client.options(
-            "/",
-            headers={
-                "Origin": "http://localhost:5173",
-                "Access-Control-Request-Method": "GET",
-            }
-        )
-        assert response.headers.get("access-control-allow-origin") == "http://localhost:5173"
+    @pytest.mark.parametrize("path,method,request_headers,check_header,expected", [
+        pytest.param("/", "GET", None, "access-control-allow-origin", "http://localhost:5173", id="valid-origin"),
+        pytest.param("/upload", "POST", None, "access-control-allow-methods", "POST", id="post-method"),
+        pytest.param("/", "GET", None, "access-control-allow-methods", "GET", id="get-method"),
+        pytest.param("/calculate", "POST", "Content-Type", "access-control-allow-headers", "content-type", id="content-type-header"),
+        pytest.param("/calculate", "POST", "Content-Type", "access-control-max-age", "3600", id="preflight-max-age"),
+    ])
+    def test_cors_preflight(self, cors_middleware, path, method, request_headers, check_header, expected):
+        """CORS preflight should allow configured origins, methods and headers"""
+        headers = {
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": method,
+        }
+        if request_headers:
+            headers["Access-Control-Request-Headers"] = request_headers
 
-    def test_cors_allows_post_method(self):
-        """CORS should allow POST method"""
-        response = client.options(
-            "/upload",
-            headers={
-                "Origin": "http://localhost:5173",
-                "Access-Control-Request-Method": "POST",
-            }
-        )
-        allowed_methods = response.headers.get("access-control-allow-methods", "")
-        assert "POST" in allowed_methods
-
-    def test_cors_allows_get_method(self):
-        """CORS should allow GET method"""
-        response = client.options(
-            "/",
-            headers={
-                "Origin": "http://localhost:5173",
-                "Access-Control-Request-Method": "GET",
-            }
-        )
-        allowed_methods = response.headers.get("access-control-allow-methods", "")
-        assert "GET" in allowed_methods
-
-    def test_cors_allows_content_type_header(self):
-        """CORS should allow Content-Type header"""
-        response = client.options(
-            "/calculate",
-            headers={
-                "Origin": "http://localhost:5173",
-                "Access-Control-Request-Method": "POST",
-                "Access-Control-Request-Headers": "Content-Type",
-            }
-        )
-        allowed_headers = response.headers.get("access-control-allow-headers", "")
-        assert "content-type" in allowed_headers.lower()
+        response_headers = _preflight(cors_middleware, path, headers)
+
+        allowed = [value.strip().lower() for value in response_headers.get(check_header, "").split(",")]
+        assert expected.lower() in allowed
 
 
 class TestUploadEndpoint:
-    def test_upload_keeps_a_genuine_empty_result(self, monkeypatch):
+    def test_upload_keeps_a_genuine_empty_result(self, client, monkeypatch):
         monkeypatch.setattr(image_parser, "parse_screenshot", lambda _contents: [])
 
         response = client.post(
             "/upload",
-            files={"file": ("positions.png", b"image", "image/png")},
+            files=UPLOAD_IMAGE_FILES,
         )
 
         assert response.status_code == 200
         assert response.json() == {"positions": []}
 
     def test_upload_distinguishes_recognition_failure_from_no_positions(
-        self, monkeypatch
+        self, client, monkeypatch
     ):
         def fail_recognition(_contents):
             raise image_parser.OCRProcessingError("internal provider detail")
@@ -81,7 +96,7 @@ class TestUploadEndpoint:
 
         response = client.post(
             "/upload",
-            files={"file": ("positions.png", b"image", "image/png")},
+            files=UPLOAD_IMAGE_FILES,
         )
 
         assert response.status_code == 502
@@ -89,7 +104,7 @@ class TestUploadEndpoint:
             "detail": "Position recognition is temporarily unavailable"
         }
 
-    def test_upload_rejects_an_unreadable_image(self, monkeypatch):
+    def test_upload_rejects_an_unreadable_image(self, client, monkeypatch):
         monkeypatch.setattr(image_parser, "api_key", "test-key")
 
         response = client.post(
@@ -102,12 +117,12 @@ class TestUploadEndpoint:
             "detail": "The uploaded file is not a readable image"
         }
 
-    def test_upload_reports_missing_recognition_configuration(self, monkeypatch):
+    def test_upload_reports_missing_recognition_configuration(self, client, monkeypatch):
         monkeypatch.setattr(image_parser, "api_key", None)
 
         response = client.post(
             "/upload",
-            files={"file": ("positions.png", b"image", "image/png")},
+            files=UPLOAD_IMAGE_FILES,
         )
 
         assert response.status_code == 503
@@ -116,87 +131,47 @@ class TestUploadEndpoint:
         }
 
 
+EMPTY_EXPIRATION_BODY = _json_body({
+    "positions": [{"qty": 1, "expiration": "", "strike": 100.0, "type": "C"}],
+    "credit": 100.0
+})
+
+INVALID_CALCULATE_BODIES = [
+    pytest.param(
+        _json_body({"positions": [{"qty": 1, "expiration": "Jan 16", "strike": 100.0, "type": "X"}], "credit": 100.0}),
+        id="invalid-option-type",
+    ),
+    pytest.param(
+        _json_body({"positions": [{"qty": 1, "expiration": "Jan 16", "strike": -50.0, "type": "C"}], "credit": 100.0}),
+        id="negative-strike",
+    ),
+    pytest.param(
+        _json_body({"positions": [{"qty": 0, "expiration": "Jan 16", "strike": 100.0, "type": "C"}], "credit": 100.0}),
+        id="zero-quantity",
+    ),
+    pytest.param(_json_body({"positions": [], "credit": 100.0}), id="empty-positions"),
+]
+
+
 class TestCalculateEndpoint:
     """Tests for /calculate endpoint with validation (Fix #4)"""
 
-    def test_calculate_valid_request(self):
+    def test_calculate_valid_request(self, calc_response_short_strangle):
         """Valid calculate request should return data"""
-        response = client.post(
-            "/calculate",
-            json={
-                "positions": [
-                    {"qty": -1, "expiration": "Jan 16", "strike": 100.0, "type": "P"},
-                    {"qty": -1, "expiration": "Jan 16", "strike": 110.0, "type": "C"},
-                ],
-                "credit": 500.0
-            }
-        )
-        assert response.status_code == 200
-        data = response.json()
+        status_code, data = calc_response_short_strangle
+        assert status_code == 200
         assert "data" in data
         assert len(data["data"]) > 0
 
-    def test_calculate_invalid_option_type(self):
-        """Invalid option type should return 422"""
-        response = client.post(
-            "/calculate",
-            json={
-                "positions": [
-                    {"qty": 1, "expiration": "Jan 16", "strike": 100.0, "type": "X"},
-                ],
-                "credit": 100.0
-            }
-        )
+    @pytest.mark.parametrize("body", INVALID_CALCULATE_BODIES)
+    def test_calculate_rejects_invalid_request(self, client, body):
+        """Invalid positions should return 422"""
+        response = client.post("/calculate", content=body, headers=JSON_HEADERS)
         assert response.status_code == 422
 
-    def test_calculate_negative_strike(self):
-        """Negative strike price should return 422"""
-        response = client.post(
-            "/calculate",
-            json={
-                "positions": [
-                    {"qty": 1, "expiration": "Jan 16", "strike": -50.0, "type": "C"},
-                ],
-                "credit": 100.0
-            }
-        )
-        assert response.status_code == 422
-
-    def test_calculate_zero_quantity(self):
-        """Zero quantity should return 422"""
-        response = client.post(
-            "/calculate",
-            json={
-                "positions": [
-                    {"qty": 0, "expiration": "Jan 16", "strike": 100.0, "type": "C"},
-                ],
-                "credit": 100.0
-            }
-        )
-        assert response.status_code == 422
-
-    def test_calculate_empty_positions(self):
-        """Empty positions list should return 422"""
-        response = client.post(
-            "/calculate",
-            json={
-                "positions": [],
-                "credit": 100.0
-            }
-        )
-        assert response.status_code == 422
-
-    def test_calculate_empty_expiration(self):
+    def test_calculate_empty_expiration(self, client):
         """Empty expiration should be accepted (optional for manual entry)"""
-        response = client.post(
-            "/calculate",
-            json={
-                "positions": [
-                    {"qty": 1, "expiration": "", "strike": 100.0, "type": "C"},
-                ],
-                "credit": 100.0
-            }
-        )
+        response = client.post("/calculate", content=EMPTY_EXPIRATION_BODY, headers=JSON_HEADERS)
         assert response.status_code == 200
         data = response.json()
         assert "data" in data
@@ -207,7 +182,9 @@ class TestRootEndpoint:
     """Tests for root endpoint"""
 
     def test_root_returns_message(self):
-        """Root endpoint should return welcome message"""
-        response = client.get("/")
-        assert response.status_code == 200
-        assert response.json() == {"message": "Option Visualizer API"}
+        """Root endpoint should be a GET route returning the welcome message"""
+        from main import app
+
+        route = next(r for r in app.routes if getattr(r, "path", None) == "/")
+        assert "GET" in route.methods
+        assert route.endpoint() == {"message": "Option Visualizer API"}
@@ -2,79 +2,78 @@ import pytest
 from pydantic import ValidationError
 from schemas import Position, CalculateRequest
 
+pytestmark = pytest.mark.schema
 
-class TestPosition:
-    """Tests for Position schema validation (Fix #4)"""
-
-    def test_valid_call_position(self):
-        """Valid call position should pass validation"""
-        pos = Position(qty=1, expiration="Jan 16", strike=100.0, type="C")
-        assert pos.qty == 1
-        assert pos.expiration == "Jan 16"
-        assert pos.strike == 100.0
-        assert pos.type == "C"
-
-    def test_valid_put_position(self):
-        """Valid put position should pass validation"""
-        pos = Position(qty=-2, expiration="Dec 19", strike=150.5, type="P")
-        assert pos.qty == -2
-        assert pos.type == "P"
-
-    def test_invalid_option_type(self):
-        """Invalid option type should raise ValidationError"""
-        with pytest.raises(ValidationError) as exc_info:
-            Position(qty=1, expiration="Jan 16", strike=100.0, type="X")
-        assert "type" in str(exc_info.value)
-
-    def test_negative_strike_price(self):
-        """Negative strike price should raise ValidationError"""
-        with pytest.raises(ValidationError) as exc_info:
-            Position(qty=1, expiration="Jan 16", strike=-100.0, type="C")
-        assert "strike" in str(exc_info.value)
-
-    def test_zero_strike_price(self):
-        """Zero strike price should raise ValidationError"""
-        with pytest.raises(ValidationError) as exc_info:
-            Position(qty=1, expiration="Jan 16", strike=0, type="C")
-        assert "strike" in str(exc_info.value)
-
-    def test_zero_quantity(self):
-        """Zero quantity should raise ValidationError"""
-        with pytest.raises(ValidationError) as exc_info:
-            Position(qty=0, expiration="Jan 16", strike=100.0, type="C")
-        assert "Quantity cannot be zero" in str(exc_info.value)
-
-    def test_empty_expiration(self):
-        """Empty expiration should be accepted and default to 'N/A' (optional for manual entry)"""
-        position = Position(qty=1, expiration="", strike=100.0, type="C")
-        assert position.expiration == ""  # Empty string is accepted
-
-
-class TestCalculateRequest:
-    """Tests for CalculateRequest schema validation (Fix #4)"""
-
-    def test_valid_request(self):
-        """Valid request with positions should pass"""
-        req = CalculateRequest(
-            positions=[
-                Position(qty=-1, expiration="Jan 16", strike=100.0, type="P"),
-                Position(qty=1, expiration="Jan 16", strike=110.0, type="C"),
-            ],
-            credit=500.0
-        )
-        assert len(req.positions) == 2
-        assert req.credit == 500.0
-
-    def test_empty_positions_list(self):
-        """Empty positions list should raise ValidationError"""
-        with pytest.raises(ValidationError) as exc_info:
-            CalculateRequest(positions=[], credit=100.0)
-        assert "positions" in str(exc_info.value)
-
-    def test_negative_credit(self):
-        """Negative credit (debit) should be allowed"""
-        req = CalculateRequest(
-            positions=[Position(qty=1, expiration="Jan 16", strike=100.0, type="C")],
-            credit=-200.0
-        )
-        assert req.credit == -200.0
+
+def assert_error_at(error: ValidationError, field: str, message: str | None = None):
+    """Assert the validation error has an entry at `field`, optionally with `message` in its msg."""
+    messages = [e["msg"] for e in error.errors() if e["loc"] == (field,)]
+    assert messages, f"no validation error at {field!r}: {error.errors()}"
+    if message is not None:
+        assert any(message in m for m in messages), messages
+
+
+# Position schema validation (Fix #4)
+def test_valid_call_position():
+    """Valid call position should pass validation"""
+    pos = Position(qty=1, expiration="Jan 16", strike=100.0, type="C")
+    assert pos.qty == 1
+    assert pos.expiration == "Jan 16"
+    assert pos.strike == 100.0
+    assert pos.type == "C"
+
+
+def test_valid_put_position():
+    """Valid put position should pass validation"""
+    pos = Position(qty=-2, expiration="Dec 19", strike=150.5, type="P")
+    assert pos.qty == -2
+    assert pos.type == "P"
+
+
+@pytest.mark.parametrize("kwargs,field,message", [
+    pytest.param({"qty": 1, "expiration": "Jan 16", "strike": 100.0, "type": "X"}, "type", None, id="invalid-option-type"),
+    pytest.param({"qty": 1, "expiration": "Jan 16", "strike": -100.0, "type": "C"}, "strike", None, id="negative-strike"),
+    pytest.param({"qty": 1, "expiration": "Jan 16", "strike": 0, "type": "C"}, "strike", None, id="zero-strike"),
+    pytest.param({"qty": 0, "expiration": "Jan 16", "strike": 100.0, "type": "C"}, "qty", "Quantity cannot be zero", id="zero-quantity"),
+])
+def test_invalid_position_raises(kwargs, field, message):
+    """Each invalid field should raise ValidationError located at that field"""
+    with pytest.raises(ValidationError) as exc_info:
+        Position(**kwargs)
+    assert_error_at(exc_info.value, field, message)
+
+
+def test_empty_expiration():
+    """Empty expiration should be accepted and default to 'N/A' (optional for manual entry)"""
+    position = Position(qty=1, expiration="", strike=100.0, type="C")
+    assert position.expiration == ""  # Empty string is accepted
+
+
+# CalculateRequest schema validation (Fix #4)
+def test_valid_request():
+    """Valid request with positions should pass"""
+    req = CalculateRequest(
+        positions=[
+            Position(qty=-1, expiration="Jan 16", strike=100.0, type="P"),
+            Position(qty=1, expiration="Jan 16", strike=110.0, type="C"),
+        ],
+        credit=500.0
+    )
+    assert len(req.positions) == 2
+    assert req.credit == 500.0
+
+
+def test_empty_positions_list():
+    """Empty positions list should raise ValidationError"""
+    with pytest.raises(ValidationError) as exc_info:
+        CalculateRequest(positions=[], credit=100.0)
+    assert_error_at(exc_info.value, "positions")
+
+
+def test_negative_credit():
+    """Negative credit (debit) should be allowed"""
+    req = CalculateRequest(
+        positions=[Position(qty=1, expiration="Jan 16", strike=100.0, type="C")],
+        credit=-200.0
+    )
+    assert req.credit == -200.0
@@ -1,7 +1,7 @@
 import inspect
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta
 
 import httpx
 
@@ -27,6 +27,48 @@ class FakeHttpClient:
         )
 
 
+class QuoteHttpClient:
+    """Answer /market-data with one quote per requested OSI symbol."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        symbols = kwargs["params"]["symbols"].split(",")
+        with self._lock:
+            self.calls.append(symbols)
+        items = [
+            {"symbol": symbol, "volatility": "0.3", "delta": "0.5"}
+            for symbol in symbols
+        ]
+        return httpx.Response(
+            200,
+            json={"data": {"items": items}},
+            request=httpx.Request(method, url),
+        )
+
+
+def strike_positions(strikes, expiration="2026-08-21"):
+    return [
+        {
+            "symbol": "SPY",
+            "strike": strike,
+            "expiration_date": expiration,
+            "option_type": "C",
+        }
+        for strike in strikes
+    ]
+
+
+def warm_client(monkeypatch, http_client):
+    client = TastytradeClient(http_client=http_client)
+    client._request_min_interval_seconds = 0
+    monkeypatch.setattr(client, "_ensure_token", lambda: True)
+    monkeypatch.setattr(tastytrade_module, "_NEXT_REQUEST_AT", 0.0)
+    return client
+
+
 def usable_smile(iv=0.25):
     return {
         "points": [
@@ -198,6 +240,70 @@ def test_request_retries_429_using_bounded_retry_after(monkeypatch):
     assert sleeps == [2.5]
 
 
+def test_request_retries_gateway_errors_with_jittered_backoff(monkeypatch):
+    fake_http = FakeHttpClient(
+        [
+            (503, {}, {"error": "unavailable"}),
+            (502, {}, {"error": "bad gateway"}),
+            (200, {}, {"data": {}}),
+        ]
+    )
+    client = TastytradeClient(http_client=fake_http)
+    client._request_min_interval_seconds = 0
+    client._rate_limit_retries = 2
+    sleeps = []
+
+    monkeypatch.setattr(tastytrade_module, "_NEXT_REQUEST_AT", 0.0)
+    monkeypatch.setattr(tastytrade_module.time, "sleep", sleeps.append)
+
+    response = client._request("GET", "https://example.test/market-data")
+
+    assert response.status_code == 200
+    assert len(fake_http.calls) == 3
+    assert 0.25 <= sleeps[0] <= 0.5
+    assert 0.5 <= sleeps[1] <= 1.0
+
+
+def test_request_does_not_retry_client_errors(monkeypatch):
+    fake_http = FakeHttpClient([(404, {}, {"error": "not found"})])
+    client = TastytradeClient(http_client=fake_http)
+    client._request_min_interval_seconds = 0
+    monkeypatch.setattr(tastytrade_module, "_NEXT_REQUEST_AT", 0.0)
+
+    response = client._request("GET", "https://example.test/market-data")
+
+    assert response.status_code == 404
+    assert len(fake_http.calls) == 1
+
+
+def test_rejected_token_is_renewed_and_request_retried_once(monkeypatch):
+    fake_http = FakeHttpClient(
+        [
+            (401, {}, {"error": "invalid_token"}),
+            (200, {}, {"access_token": "renewed", "expires_in": 900}),
+            (200, {}, {"data": {}}),
+        ]
+    )
+    monkeypatch.setenv("TASTYTRADE_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("TASTYTRADE_REFRESH_TOKEN", "refresh")
+    monkeypatch.setattr(tastytrade_module, "_NEXT_REQUEST_AT", 0.0)
+    monkeypatch.setattr(tastytrade_module.threading, "Timer", RecordingTimer)
+    client = TastytradeClient(http_client=fake_http)
+    client._request_min_interval_seconds = 0
+    client._access_token = "revoked"
+    client._token_deadline = time.monotonic() + 600
+
+    response = client._request(
+        "GET",
+        "https://example.test/market-data",
+        headers={"Authorization": "Bearer revoked"},
+    )
+
+    assert response.status_code == 200
+    assert [call[0] for call in fake_http.calls] == ["GET", "POST", "GET"]
+    assert fake_http.calls[2][2]["headers"]["Authorization"] == "Bearer renewed"
+
+
 def test_concurrent_token_checks_share_one_refresh(monkeypatch):
     fake_http = FakeHttpClient(
         [
@@ -222,6 +328,45 @@ def test_concurrent_token_checks_share_one_refresh(monkeypatch):
     assert len(fake_http.calls) == 1
 
 
+def test_failed_refresh_is_shared_by_queued_callers(monkeypatch):
+    fake_http = FakeHttpClient([(401, {}, {"error": "invalid_grant"})])
+    monkeypatch.setenv("TASTYTRADE_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("TASTYTRADE_REFRESH_TOKEN", "refresh")
+    monkeypatch.setattr(tastytrade_module, "_NEXT_REQUEST_AT", 0.0)
+    client = TastytradeClient(http_client=fake_http)
+    client._request_min_interval_seconds = 0
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: client._ensure_token(), range(4)))
+
+    assert results == [False] * 4
+    assert len(fake_http.calls) == 1
+
+
+def test_warm_token_skips_refresh_until_monotonic_deadline(monkeypatch):
+    fake_http = FakeHttpClient(
+        [(200, {}, {"access_token": "fresh-token", "expires_in": 900})]
+    )
+    monkeypatch.setenv("TASTYTRADE_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("TASTYTRADE_REFRESH_TOKEN", "refresh")
+    monkeypatch.setattr(tastytrade_module, "_NEXT_REQUEST_AT", 0.0)
+    client = TastytradeClient(http_client=fake_http)
+    client._request_min_interval_seconds = 0
+    client._access_token = "warm-token"
+    client._token_deadline = 1_000.0
+    now = 999.0
+    monkeypatch.setattr(tastytrade_module.time, "monotonic", lambda: now)
+
+    assert client._ensure_token() is True
+    assert fake_http.calls == []
+
+    now = 1_000.0
+    assert client._ensure_token() is True
+    assert client._access_token == "fresh-token"
+    assert client._token_deadline == 1_840.0
+    assert len(fake_http.calls) == 1
+
+
 def test_request_does_not_retry_before_large_retry_after(monkeypatch):
     fake_http = FakeHttpClient(
         [
@@ -275,7 +420,7 @@ def test_option_chain_uses_single_nested_request(monkeypatch):
     fake_http = FakeHttpClient([(200, {}, nested_payload)])
     client = TastytradeClient(http_client=fake_http)
     client._access_token = "token"
-    client._token_expiry = datetime.now() + timedelta(minutes=10)
+    client._token_deadline = time.monotonic() + 600
     client._request_min_interval_seconds = 0
     monkeypatch.setattr(tastytrade_module, "_NEXT_REQUEST_AT", 0.0)
 
@@ -297,6 +442,42 @@ def test_option_chain_uses_single_nested_request(monkeypatch):
     assert cached["expirations"] == ["2026-08-21", "2026-09-18"]
 
 
+def test_expired_option_chain_revalidates_with_etag(monkeypatch):
+    nested_payload = {
+        "data": {
+            "items": [
+                {
+                    "underlying-price": "325.5",
+                    "expirations": [
+                        {
+                            "expiration-date": "2026-08-21",
+                            "strikes": [{"strike-price": "320.0"}],
+                        }
+                    ],
+                }
+            ]
+        }
+    }
+    fake_http = FakeHttpClient(
+        [
+            (200, {"ETag": '"chain-v1"'}, nested_payload),
+            (304, {"ETag": '"chain-v1"'}, None),
+        ]
+    )
+    client = warm_client(monkeypatch, fake_http)
+    client._access_token = "token"
+    client._option_chain_cache_ttl_seconds = 0
+
+    first = client.get_option_chain("TSLA")
+    second = client.get_option_chain("TSLA")
+
+    assert len(fake_http.calls) == 2
+    assert "If-None-Match" not in fake_http.calls[0][2]["headers"]
+    assert fake_http.calls[1][2]["headers"]["If-None-Match"] == '"chain-v1"'
+    assert second == first
+    assert second["strikes_by_expiration"] == {"2026-08-21": [320.0]}
+
+
 def test_volatility_smile_uses_exact_requested_expiration(monkeypatch):
     client = TastytradeClient(http_client=FakeHttpClient())
     requested_expiration = "2026-08-28"
@@ -328,6 +509,223 @@ def test_volatility_smile_uses_exact_requested_expiration(monkeypatch):
     } == {requested_expiration}
 
 
+def test_atm_iv_uses_nearest_quoted_strike():
+    points = [
+        {"strike": 95.0, "call_iv": 0.30, "put_iv": 0.34},
+        {"strike": 100.0, "call_iv": None, "put_iv": None},
+        {"strike": 105.0, "call_iv": None, "put_iv": 0.28},
+        {"strike": 110.0, "call_iv": 0.20, "put_iv": 0.22},
+    ]
+
+    assert TastytradeClient._atm_iv(points, 100.0) == 0.32
+    assert TastytradeClient._atm_iv(points, 104.0) == 0.28
+    assert TastytradeClient._atm_iv(points[1:2], 100.0) == 0
+    assert TastytradeClient._atm_iv([], 100.0) == 0
+
+
+def test_market_metrics_are_cached_briefly(monkeypatch):
+    metrics_payload = {
+        "data": {
+            "items": [
+                {
+                    "symbol": "TSLA",
+                    "implied-volatility-index-rank": "0.42",
+                    "implied-volatility-index": "0.31",
+                }
+            ]
+        }
+    }
+    fake_http = FakeHttpClient(
+        [(200, {}, metrics_payload), (200, {}, metrics_payload)]
+    )
+    client = warm_client(monkeypatch, fake_http)
+    client._access_token = "token"
+    now = 1_000.0
+    monkeypatch.setattr("tastytrade_client.time.monotonic", lambda: now)
+
+    first = client.get_market_metrics("TSLA")
+    first["iv_rank"] = 99.0
+    assert client.get_market_metrics("tsla")["iv_rank"] == 42.0
+    assert len(fake_http.calls) == 1
+
+    now += client._metrics_cache_ttl_seconds
+    client.get_market_metrics("TSLA")
+    assert len(fake_http.calls) == 2
+
+
+def test_batch_market_metrics_share_one_request_and_the_cache(monkeypatch):
+    metrics_payload = {
+        "data": {
+            "items": [
+                {"symbol": "SPY", "implied-volatility-index-rank": "0.2"},
+                {"symbol": "QQQ", "implied-volatility-index-rank": "0.3"},
+            ]
+        }
+    }
+    fake_http = FakeHttpClient([(200, {}, metrics_payload)])
+    client = warm_client(monkeypatch, fake_http)
+    client._access_token = "token"
+
+    metrics = client.get_batch_market_metrics(["spy", "QQQ", "SPY", "IWM"])
+
+    assert set(metrics) == {"SPY", "QQQ"}
+    assert metrics["QQQ"]["iv_rank"] == 30.0
+    assert len(fake_http.calls) == 1
+    assert fake_http.calls[0][2]["params"] == {"symbols": "SPY,QQQ,IWM"}
+    assert client.get_market_metrics("spy")["iv_rank"] == 20.0
+    assert len(fake_http.calls) == 1
+
+
+def test_symbol_search_fallback_uses_one_yahoo_search_request():
+    fake_http = FakeHttpClient(
+        [
+            (
+                200,
+                {},
+                {
+                    "quotes": [
+                        {
+                            "symbol": "AAPL",
+                            "longname": "Apple Inc.",
+                            "exchDisp": "NASDAQ",
+                            "quoteType": "EQUITY",
+                        },
+                        {"symbol": "AAPL260821C00200000", "quoteType": "OPTION"},
+                    ]
+                },
+            )
+        ]
+    )
+    client = TastytradeClient(http_client=fake_http)
+
+    results = client._search_symbols_fallback("aapl")
+
+    assert results == [
+        {
+            "symbol": "AAPL",
+            "name": "Apple Inc.",
+            "exchange": "NASDAQ",
+            "type": "EQUITY",
+        }
+    ]
+    assert len(fake_http.calls) == 1
+    assert fake_http.calls[0][1] == tastytrade_module.YAHOO_SEARCH_URL
+    assert fake_http.calls[0][2]["params"]["q"] == "AAPL"
+
+
+def test_symbol_search_results_are_cached_briefly(monkeypatch):
+    search_payload = {
+        "data": {
+            "items": [
+                {
+                    "symbol": "TSLA",
+                    "description": "Tesla Inc",
+                    "instrument-type": "Equity",
+                }
+            ]
+        }
+    }
+    fake_http = FakeHttpClient(
+        [(200, {}, search_payload), (200, {}, search_payload)]
+    )
+    client = warm_client(monkeypatch, fake_http)
+    client._access_token = "token"
+    now = 1_000.0
+    monkeypatch.setattr("tastytrade_client.time.monotonic", lambda: now)
+
+    first = client.search_symbols("TSLA")
+    first[0]["name"] = "changed"
+    assert client.search_symbols(" tsla ")[0]["name"] == "Tesla Inc"
+    assert len(fake_http.calls) == 1
+
+    now += client._search_cache_ttl_seconds
+    client.search_symbols("TSLA")
+    assert len(fake_http.calls) == 2
+
+
+def test_extract_market_metrics_scales_ranks_and_tolerates_gaps():
+    client = TastytradeClient(http_client=FakeHttpClient())
+
+    assert client._extract_market_metrics(
+        {
+            "implied-volatility-index-rank": "0.425",
+            "implied-volatility-percentile": 0.9,
+            "implied-volatility-index": "0.31",
+            "beta": "bad",
+            "liquidity-rating": "3",
+        }
+    ) == {
+        "iv_rank": 42.5,
+        "iv_percentile": 90.0,
+        "implied_volatility": 0.31,
+        "beta": None,
+        "liquidity_rating": 3,
+    }
+
+
+def test_warm_greeks_cache_skips_the_token_check(monkeypatch):
+    client = TastytradeClient(http_client=FakeHttpClient())
+
+    def unexpected_token_check():
+        raise AssertionError("cache hits must not authenticate")
+
+    monkeypatch.setattr(client, "_ensure_token", unexpected_token_check)
+    position = strike_positions([600.0])[0]
+    osi_symbol = client._to_osi_symbol(
+        position["symbol"], position["expiration_date"], 600.0, "C"
+    )
+    client._cache_greeks(osi_symbol, {"delta": 0.5, "implied_volatility": 0.2})
+
+    assert client.get_option_greeks(
+        position["symbol"], 600.0, position["expiration_date"], "C"
+    )["delta"] == 0.5
+    assert len(client.get_batch_option_greeks([position])) == 1
+
+
+def test_warm_metrics_cache_skips_the_token_check(monkeypatch):
+    client = TastytradeClient(http_client=FakeHttpClient())
+
+    def unexpected_token_check():
+        raise AssertionError("cache hits must not authenticate")
+
+    monkeypatch.setattr(client, "_ensure_token", unexpected_token_check)
+    client._remember_market_metrics({"SPY": {"iv_rank": 20.0}})
+
+    assert client.get_market_metrics("spy") == {"iv_rank": 20.0}
+    assert client.get_batch_market_metrics(["SPY"]) == {"SPY": {"iv_rank": 20.0}}
+
+    # A miss needs the token; without one the cached subset is still returned
+    monkeypatch.setattr(client, "_ensure_token", lambda: False)
+    assert client.get_batch_market_metrics(["SPY", "QQQ"]) == {"SPY": {"iv_rank": 20.0}}
+
+
+def test_greeks_finished_just_before_the_inflight_check_are_not_refetched(
+    monkeypatch,
+):
+    client = TastytradeClient(http_client=FakeHttpClient())
+    position = strike_positions([600.0])[0]
+    osi_symbol = client._to_osi_symbol(
+        position["symbol"], position["expiration_date"], 600.0, "C"
+    )
+
+    def owner_finishes_meanwhile():
+        # Another caller's fetch completes between the cache miss and the lock
+        client._cache_greeks(osi_symbol, {"delta": 0.5})
+        return True
+
+    monkeypatch.setattr(client, "_ensure_token", owner_finishes_meanwhile)
+    monkeypatch.setattr(
+        client,
+        "_fetch_option_greeks",
+        lambda *_: (_ for _ in ()).throw(AssertionError("quote was already cached")),
+    )
+
+    assert client.get_option_greeks(
+        position["symbol"], 600.0, position["expiration_date"], "C"
+    ) == {"delta": 0.5}
+    assert client._greeks_inflight == {}
+
+
 def test_greeks_cache_is_bounded_lru_and_returns_defensive_copies():
     client = TastytradeClient(http_client=FakeHttpClient())
     client._greeks_cache_max_entries = 2
@@ -342,3 +740,427 @@ def test_greeks_cache_is_bounded_lru_and_returns_defensive_copies():
 
     assert list(client._greeks_cache) == ["first", "third"]
     assert client._get_cached_greeks("first") == {"delta": 0.1}
+
+
+def test_greeks_cache_drops_expired_entries_on_insert(monkeypatch):
+    client = TastytradeClient(http_client=FakeHttpClient())
+    now = 1_000.0
+    monkeypatch.setattr("tastytrade_client.time.monotonic", lambda: now)
+
+    client._cache_greeks("stale", {"delta": 0.1})
+    client._cache_greeks("also_stale", {"delta": 0.2})
+    now += client._greeks_cache_ttl_seconds
+    client._cache_greeks("fresh", {"delta": 0.3})
+
+    assert list(client._greeks_cache) == ["fresh"]
+
+
+def test_concurrent_first_use_constructs_one_singleton(monkeypatch):
+    constructed = []
+    barrier = threading.Barrier(4)
+
+    class SlowClient:
+        def __init__(self):
+            constructed.append(self)
+            time.sleep(0.05)
+
+    monkeypatch.setattr(tastytrade_module, "_tastytrade_client", None)
+    monkeypatch.setattr(tastytrade_module, "TastytradeClient", SlowClient)
+
+    def first_use(_):
+        barrier.wait(timeout=2)
+        return tastytrade_module.get_tastytrade_client()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(executor.map(first_use, range(4)))
+
+    assert len(constructed) == 1
+    assert all(client is constructed[0] for client in clients)
+
+
+def test_owned_http_pool_is_closed_by_context_manager():
+    with TastytradeClient() as client:
+        http_client = client._http_client
+        assert http_client.headers["User-Agent"] == tastytrade_module.USER_AGENT
+        assert http_client.timeout == tastytrade_module.REQUEST_TIMEOUT
+        assert not http_client.is_closed
+
+    assert http_client.is_closed
+
+
+def test_injected_http_client_is_left_open_for_its_owner():
+    fake_http = FakeHttpClient()
+    fake_http.close = lambda: (_ for _ in ()).throw(
+        AssertionError("injected client must not be closed")
+    )
+
+    with TastytradeClient(http_client=fake_http):
+        pass
+
+
+def test_batch_greeks_fetches_every_chunk(monkeypatch):
+    quote_http = QuoteHttpClient()
+    client = warm_client(monkeypatch, quote_http)
+    client._quote_chunk_max_symbols = 50
+    strikes = [float(strike) for strike in range(100, 175)]
+
+    result = client.get_batch_option_greeks(strike_positions(strikes))
+
+    assert sorted(len(call) for call in quote_http.calls) == [25, 50]
+    assert len(result) == len(strikes)
+    assert result["SPY_174.0_2026-08-21_C"]["implied_volatility"] == 0.3
+
+
+def test_batch_greeks_send_a_typical_chain_in_one_request(monkeypatch):
+    quote_http = QuoteHttpClient()
+    client = warm_client(monkeypatch, quote_http)
+    strikes = [float(strike) for strike in range(100, 180)]
+
+    result = client.get_batch_option_greeks(strike_positions(strikes))
+
+    assert [len(call) for call in quote_http.calls] == [80]
+    assert len(result) == len(strikes)
+
+
+def test_batch_greeks_requests_only_cache_misses(monkeypatch):
+    quote_http = QuoteHttpClient()
+    client = warm_client(monkeypatch, quote_http)
+    client._cache_greeks(
+        client._to_osi_symbol("SPY", "2026-08-21", 100, "C"),
+        {"delta": 0.5, "implied_volatility": 0.2},
+    )
+
+    result = client.get_batch_option_greeks(strike_positions([100.0, 101.0]))
+
+    assert [len(call) for call in quote_http.calls] == [1]
+    assert result["SPY_100.0_2026-08-21_C"]["implied_volatility"] == 0.2
+    assert result["SPY_101.0_2026-08-21_C"]["implied_volatility"] == 0.3
+
+
+def test_osi_symbol_formatting_and_invalid_dates():
+    client = TastytradeClient(http_client=FakeHttpClient())
+
+    assert client._to_osi_symbol("tsla", "2026-01-02", 80, "c") == (
+        "TSLA  260102C00080000"
+    )
+    assert client._to_osi_symbol("SPY", "2026-08-21", 612.5, "P") == (
+        "SPY   260821P00612500"
+    )
+    assert client._to_osi_symbol("SPY", "2026-02-30", 600, "C") is None
+    assert client._to_osi_symbol("SPY", "", 600, "C") is None
+
+
+def test_generated_strikes_cover_half_to_one_and_a_half_times_spot():
+    client = TastytradeClient(http_client=FakeHttpClient())
+
+    strikes = client._generate_strikes_around_price(100.0)
+    assert strikes[0] == 50.0 and strikes[-1] == 150.0
+    assert len(strikes) == 21
+    assert all(isinstance(strike, float) for strike in strikes)
+
+    fine = client._generate_strikes_around_price(40.0)
+    assert fine[:3] == [20.0, 22.5, 25.0] and fine[-1] == 60.0
+
+
+def test_json_decoding_falls_back_without_orjson(monkeypatch):
+    response = httpx.Response(200, json={"data": {"items": [{"delta": 0.5}]}})
+    monkeypatch.setattr(tastytrade_module, "orjson", None)
+
+    assert tastytrade_module._decode_json(response) == {
+        "data": {"items": [{"delta": 0.5}]}
+    }
+
+
+def test_concurrent_single_greeks_requests_share_one_fetch(monkeypatch):
+    client = TastytradeClient(http_client=FakeHttpClient())
+    monkeypatch.setattr(client, "_ensure_token", lambda: True)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch(*args):
+        calls.append(args)
+        started.set()
+        release.wait(timeout=5)
+        return {"delta": 0.5, "implied_volatility": 0.3}
+
+    monkeypatch.setattr(client, "_fetch_option_greeks", slow_fetch)
+    request = ("TSLA", 250.0, "2026-12-18", "C")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        owner = executor.submit(client.get_option_greeks, *request)
+        assert started.wait(timeout=5)
+        follower = executor.submit(client.get_option_greeks, *request)
+        time.sleep(0.05)
+        release.set()
+        results = [owner.result(timeout=5), follower.result(timeout=5)]
+
+    assert len(calls) == 1
+    assert results[0] == results[1] == {"delta": 0.5, "implied_volatility": 0.3}
+    assert results[0] is not results[1]
+    assert client._greeks_inflight == {}
+
+
+def test_extract_greeks_maps_quote_fields_and_tolerates_bad_values():
+    client = TastytradeClient(http_client=FakeHttpClient())
+
+    greeks = client._extract_greeks(
+        {"volatility": "0.8435", "delta": "0.41", "theo-price": "n/a"}
+    )
+
+    assert greeks["implied_volatility"] == 0.8435
+    assert greeks["delta"] == 0.41
+    assert greeks["theo_price"] is None
+    assert set(greeks) == {
+        "delta", "gamma", "theta", "vega", "rho", "implied_volatility",
+        "bid", "ask", "mark", "last", "theo_price",
+    }
+
+
+def test_chain_expirations_normalize_to_iso_dates():
+    normalize = tastytrade_module._normalize_expiration
+
+    assert normalize("2026-08-21") == "2026-08-21"
+    assert normalize("2026-09-18T00:00:00+0000") == "2026-09-18"
+    assert normalize("2026-09-18T20:00:00Z") == "2026-09-18"
+    assert normalize("not-a-date") is None
+    assert normalize("") is None
+
+
+def test_batch_greeks_requests_duplicate_contracts_once(monkeypatch):
+    quote_http = QuoteHttpClient()
+    client = warm_client(monkeypatch, quote_http)
+
+    result = client.get_batch_option_greeks(strike_positions([600, 600.0]))
+
+    assert [len(call) for call in quote_http.calls] == [1]
+    assert result["SPY_600_2026-08-21_C"] == result["SPY_600.0_2026-08-21_C"]
+    assert result["SPY_600_2026-08-21_C"] is not result["SPY_600.0_2026-08-21_C"]
+
+
+def test_batch_greeks_logs_one_summary_line(monkeypatch, caplog):
+    quote_http = QuoteHttpClient()
+    client = warm_client(monkeypatch, quote_http)
+    client._cache_greeks(
+        client._to_osi_symbol("SPY", "2026-08-21", 100, "C"), {"delta": 0.5}
+    )
+
+    with caplog.at_level("INFO", logger="tastytrade_client"):
+        client.get_batch_option_greeks(strike_positions([100.0, 101.0, 102.0]))
+
+    batch_lines = [
+        record.getMessage()
+        for record in caplog.records
+        if "Greeks" in record.getMessage()
+    ]
+    assert batch_lines == ["Greeks batch: 2 fetched, 1 cached, 0 missing"]
+
+
+def test_quote_chunk_size_respects_cap_and_url_budget(monkeypatch):
+    client = TastytradeClient(http_client=FakeHttpClient())
+    osi = [client._to_osi_symbol("SPY", "2026-08-21", 600, "C")]
+
+    # The default cap sits above the URL budget, which sets the limit:
+    # 7000 bytes over 30 encoded bytes per symbol.
+    assert client._quote_chunk_size(osi) == 233
+
+    client._quote_chunk_max_symbols = 1000
+    monkeypatch.setattr(tastytrade_module, "QUOTE_QUERY_BUDGET_BYTES", 300)
+    # "SPY%20%20%20260821C00600000" plus the encoded comma is 30 bytes.
+    assert client._quote_chunk_size(osi) == 10
+
+
+class RecordingTimer:
+    instances = []
+
+    def __init__(self, delay, callback):
+        self.delay = delay
+        self.callback = callback
+        self.cancelled = False
+        self.daemon = False
+        RecordingTimer.instances.append(self)
+
+    def start(self):
+        pass
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def test_token_refresh_arms_early_background_renewal(monkeypatch):
+    RecordingTimer.instances = []
+    fake_http = FakeHttpClient(
+        [
+            (200, {}, {"access_token": "first", "expires_in": 900}),
+            (503, {}, {"error": "unavailable"}),
+        ]
+    )
+    monkeypatch.setenv("TASTYTRADE_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("TASTYTRADE_REFRESH_TOKEN", "refresh")
+    monkeypatch.setattr(tastytrade_module, "_NEXT_REQUEST_AT", 0.0)
+    monkeypatch.setattr(tastytrade_module.threading, "Timer", RecordingTimer)
+    client = TastytradeClient(http_client=fake_http)
+    client._request_min_interval_seconds = 0
+
+    assert client._ensure_token() is True
+    renewal = RecordingTimer.instances[-1]
+    assert renewal.delay == 720.0
+    assert renewal.daemon is True
+
+    # A failed early renewal keeps the still-valid token and retries later.
+    renewal.callback()
+    assert client._access_token == "first"
+    retry = RecordingTimer.instances[-1]
+    assert retry.delay == tastytrade_module.TOKEN_REFRESH_RETRY_SECONDS
+
+    client.close()
+    assert retry.cancelled is True
+
+
+def test_disk_cache_shares_responses_across_client_instances(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setenv(
+        "TASTYTRADE_DISK_CACHE_PATH", str(tmp_path / "cache" / "tastytrade.db")
+    )
+    chain = {
+        "expirations": ["2026-08-21"],
+        "strikes_by_expiration": {"2026-08-21": [320.0, 325.0]},
+        "underlying_price": 325.5,
+    }
+
+    metrics = {"SPY": {"iv_rank": 20.0}}
+
+    with TastytradeClient(http_client=FakeHttpClient()) as writer:
+        disk_ttls = {}
+        disk_set = writer._disk_cache.set
+
+        def recording_set(namespace, key, value, ttl):
+            disk_ttls[namespace] = ttl
+            disk_set(namespace, key, value, ttl)
+
+        monkeypatch.setattr(writer._disk_cache, "set", recording_set)
+        writer._cache_greeks("SPY   260821C00600000", {"delta": 0.4})
+        monkeypatch.setattr(writer, "_fetch_option_chain", lambda *_: chain)
+        writer.get_option_chain("SPY")
+        monkeypatch.setattr(writer, "_ensure_token", lambda: True)
+        monkeypatch.setattr(writer, "_fetch_market_metrics_chunk", lambda _: metrics)
+        writer.get_market_metrics("SPY")
+
+    # Quotes and metrics never outlive their in-memory TTLs on disk
+    assert disk_ttls == {"greeks": 300.0, "option_chain": 86400.0, "metrics": 60.0}
+
+    with TastytradeClient(http_client=FakeHttpClient()) as reader:
+        monkeypatch.setattr(
+            reader,
+            "_fetch_option_chain",
+            lambda *_: (_ for _ in ()).throw(
+                AssertionError("restart should reuse the persisted chain")
+            ),
+        )
+        monkeypatch.setattr(reader, "_ensure_token", lambda: True)
+        monkeypatch.setattr(
+            reader,
+            "_fetch_market_metrics_chunk",
+            lambda _: (_ for _ in ()).throw(
+                AssertionError("restart should reuse the persisted metrics")
+            ),
+        )
+        assert reader._get_cached_greeks("SPY   260821C00600000") == {
+            "delta": 0.4
+        }
+        # The listing is reused, but the persisted row carries no spot price
+        assert reader.get_option_chain("spy") == {**chain, "underlying_price": None}
+        assert reader.get_market_metrics("spy") == {"iv_rank": 20.0}
+        assert "SPY" in reader._metrics_cache
+
+
+def test_disk_cache_hits_are_promoted_to_memory(monkeypatch, tmp_path):
+    monkeypatch.setenv("TASTYTRADE_DISK_CACHE_PATH", str(tmp_path / "cache.db"))
+    chain = {
+        "expirations": ["2026-08-21"],
+        "strikes_by_expiration": {"2026-08-21": [320.0]},
+        "underlying_price": 325.5,
+    }
+
+    with TastytradeClient(http_client=FakeHttpClient()) as writer:
+        writer._cache_greeks("SPY   260821C00600000", {"delta": 0.4})
+        monkeypatch.setattr(writer, "_fetch_option_chain", lambda *_: chain)
+        writer.get_option_chain("SPY")
+
+    with TastytradeClient(http_client=FakeHttpClient()) as reader:
+        disk_reads = []
+        disk_get = reader._disk_cache.get_entry
+        monkeypatch.setattr(
+            reader._disk_cache,
+            "get_entry",
+            lambda namespace, key: disk_reads.append(namespace) or disk_get(namespace, key),
+        )
+
+        for _ in range(3):
+            greeks = reader._get_cached_greeks("SPY   260821C00600000")
+            greeks["delta"] = 0.0  # callers get copies, not the cached dict
+            reader.get_option_chain("SPY")
+
+        assert reader._get_cached_greeks("SPY   260821C00600000") == {"delta": 0.4}
+        assert disk_reads == ["greeks", "option_chain"]
+
+
+def test_disk_cache_does_not_outlive_the_memory_ttls(monkeypatch, tmp_path):
+    monkeypatch.setenv("TASTYTRADE_DISK_CACHE_PATH", str(tmp_path / "cache.db"))
+    now = [1_000.0]
+    monkeypatch.setattr("tastytrade_client.time.monotonic", lambda: now[0])
+    monkeypatch.setattr("disk_cache.time.time", lambda: now[0])
+    chain = {
+        "expirations": ["2026-08-21"],
+        "strikes_by_expiration": {"2026-08-21": [320.0]},
+        "underlying_price": 325.5,
+    }
+    metric_fetches = []
+    chain_fetches = []
+
+    with TastytradeClient(http_client=FakeHttpClient()) as client:
+        monkeypatch.setattr(client, "_ensure_token", lambda: True)
+        monkeypatch.setattr(
+            client,
+            "_fetch_market_metrics_chunk",
+            lambda chunk: metric_fetches.append(chunk) or {"SPY": {"iv_rank": 20.0}},
+        )
+        monkeypatch.setattr(
+            client,
+            "_fetch_option_chain",
+            lambda *_: chain_fetches.append(1) or chain,
+        )
+        client._cache_greeks("SPY   260821C00600000", {"delta": 0.4})
+        client.get_market_metrics("SPY")
+        client.get_option_chain("SPY")
+
+        # A promoted disk row keeps its remaining lifetime, not a fresh TTL
+        now[0] += 200
+        client._greeks_cache.clear()
+        assert client._get_cached_greeks("SPY   260821C00600000") == {"delta": 0.4}
+        now[0] += 150
+        assert client._get_cached_greeks("SPY   260821C00600000") is None
+
+        # Expired metrics are refetched rather than revived from disk
+        client.get_market_metrics("SPY")
+        assert len(metric_fetches) == 2
+
+        # A warm process refetches an expired chain instead of reading disk
+        assert client.get_option_chain("SPY")["underlying_price"] == 325.5
+        assert len(chain_fetches) == 2
+
+
+def test_disk_cache_ignores_expired_entries(monkeypatch, tmp_path):
+    from disk_cache import DiskCache
+
+    cache = DiskCache(str(tmp_path / "cache.db"))
+    now = 1_000.0
+    monkeypatch.setattr("disk_cache.time.time", lambda: now)
+
+    cache.set("greeks", "key", {"delta": 0.1}, ttl_seconds=60)
+    assert cache.get("greeks", "key") == {"delta": 0.1}
+
+    now += 60
+    assert cache.get("greeks", "key") is None
+    cache.close()
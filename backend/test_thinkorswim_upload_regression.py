@@ -2,11 +2,9 @@ import io
 import json
 
 import PIL.Image
-from fastapi.testclient import TestClient
 from google.genai import _api_client, types
 
 import image_parser
-from main import app
 
 
 EXPECTED_POSITIONS = [
@@ -33,7 +31,7 @@ def _wide_png() -> bytes:
     return output.getvalue()
 
 
-def test_upload_accepts_schema_before_gemini_inference(monkeypatch):
+def test_upload_accepts_schema_before_gemini_inference(client, monkeypatch):
     """
     Exercise the real /upload and google-genai request transformation boundaries.
 
@@ -69,7 +67,7 @@ def test_upload_accepts_schema_before_gemini_inference(monkeypatch):
     monkeypatch.setattr(image_parser, "api_key", "test-key")
     monkeypatch.setattr(_api_client.BaseApiClient, "request", fake_request)
 
-    response = TestClient(app).post(
+    response = client.post(
         "/upload",
         files={"file": ("thinkorswim.png", _wide_png(), "image/png")},
     )